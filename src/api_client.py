@@ -1,16 +1,134 @@
 #!/usr/bin/env python3
 
+import hashlib
+import threading
 import requests
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Optional, Any, Callable
 from models import Replica, Persona, Video, Conversation
+import cache
 
 class TavusAPIClient:
   """Client for interacting with the Tavus API"""
   
+  # Seconds to wait for a list request to connect or send data. Lists are also
+  # fetched on background threads, which interpreter exit waits for, so a
+  # stalled connection must not block quitting for long.
+  LIST_TIMEOUT = 10
+  
   def __init__(self, api_key: str):
     self.api_key = api_key
     self.base_url = "https://tavusapi.com/v2"
     self.headers = {"x-api-key": api_key}
+    
+    # Reuse one session so every call shares a keep-alive connection pool
+    self.session = requests.Session()
+    self.session.headers.update(self.headers)
+    
+    # ETag-validated list responses, persisted per API key so they survive restarts.
+    # Each URL is stored in its own file and read from disk on first use.
+    self._cache_name = "responses-" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    self._response_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+    # Background prefetches share the client, so guard the response cache
+    self._cache_lock = threading.Lock()
+    # Model objects last built per URL, with the response data they were built from
+    self._parsed_lists: Dict[str, Tuple[Any, List[Any]]] = {}
+  
+  def _cached_get(self, url: str) -> Tuple[int, Any, str]:
+    """
+    GET a URL, revalidating any cached copy with If-None-Match
+    
+    Responses without an ETag are compared by a SHA-256 of their body instead,
+    so an unchanged list still skips JSON decoding.
+    
+    Args:
+      url: The URL to fetch
+      
+    Returns:
+      Tuple[int, Any, str]: (status_code, response_json, response_text)
+        A 304 Not Modified or an unchanged body is reported as 200 with the cached data
+    """
+    with self._cache_lock:
+      if url not in self._response_cache:
+        self._response_cache[url] = cache.load(self._cache_entry_name(url))
+      entry = self._response_cache[url]
+    etag = entry.get("etag") if entry else None
+    headers = {"If-None-Match": etag} if etag else None
+    response = self.session.request("GET", url, headers=headers, timeout=self.LIST_TIMEOUT)
+    
+    if response.status_code == 304 and entry:
+      return 200, entry["data"], ""
+    if response.status_code != 200:
+      return response.status_code, None, response.text
+    
+    etag = response.headers.get("ETag")
+    digest = None
+    if not etag:
+      digest = hashlib.sha256(response.content).hexdigest()
+      if entry and entry.get("sha256") == digest:
+        return 200, entry["data"], ""
+    
+    response_data = response.json()
+    if etag:
+      entry = {"etag": etag, "data": response_data}
+    else:
+      entry = {"sha256": digest, "data": response_data}
+    with self._cache_lock:
+      self._response_cache[url] = entry
+    # Only the changed entry is written; it is never mutated once stored
+    cache.save(self._cache_entry_name(url), entry)
+    return 200, response_data, response.text
+  
+  def _cache_entry_name(self, url: str) -> str:
+    """Return the on-disk cache entry name for a URL"""
+    return f"{self._cache_name}/{hashlib.sha256(url.encode()).hexdigest()[:32]}"
+  
+  def _parse_list(self, url: str, response_data: Any, from_dict: Callable[[Dict], Any],
+                  id_key: str) -> List[Any]:
+    """
+    Build model objects from a list response, reusing the last ones built for the URL
+    
+    A 304 Not Modified hands back the very same cached data object, so the
+    objects built from it can be reused instead of running from_dict again.
+    When the list did change, entries whose data is identical to last time
+    still keep their existing object (and its cached display strings).
+    
+    Args:
+      url: The URL the response was fetched from
+      response_data: The parsed JSON response
+      from_dict: Model constructor for one entry of the response's data list
+      id_key: Key holding the entry's ID, used to match it with the previous response
+      
+    Returns:
+      List[Any]: A new list, so callers may add and remove entries freely
+    """
+    with self._cache_lock:
+      parsed = self._parsed_lists.get(url)
+    if parsed is not None and parsed[0] is response_data:
+      return list(parsed[1])
+    
+    items_data = response_data.get('data', [])
+    if parsed is None:
+      items = [from_dict(item_data) for item_data in items_data]
+    else:
+      # Match unchanged entries of the previous response by ID
+      previous = {item_data.get(id_key): (item_data, item)
+                  for item_data, item in zip(parsed[0].get('data', []), parsed[1])}
+      items = []
+      for item_data in items_data:
+        match = previous.get(item_data.get(id_key))
+        items.append(match[1] if match is not None and match[0] == item_data else from_dict(item_data))
+    with self._cache_lock:
+      self._parsed_lists[url] = (response_data, items)
+    return list(items)
+  
+  def clear_response_cache(self) -> None:
+    """Forget all cached list responses, in memory and on disk"""
+    with self._cache_lock:
+      self._response_cache = {}
+      self._parsed_lists = {}
+      cache.clear_group(self._cache_name)
+    # Responses saved before entries were stored per URL
+    cache.clear(self._cache_name)
   
   def list_replicas(self, limit: int = 1000) -> Tuple[bool, str, List[Replica]]:
     """
@@ -25,15 +143,13 @@ class TavusAPIClient:
     url = f"{self.base_url}/replicas?verbose=true&limit={limit}"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      status_code, response_data, response_text = self._cached_get(url)
       
-      if response.status_code == 200:
-        response_data = response.json()
-        replicas_data = response_data.get('data', [])
-        replicas = [Replica.from_dict(replica_data) for replica_data in replicas_data]
+      if status_code == 200:
+        replicas = self._parse_list(url, response_data, Replica.from_dict, "replica_id")
         return True, f"Successfully fetched {len(replicas)} replica(s)", replicas
       else:
-        return False, f"Error: HTTP {response.status_code} - {response.text}", []
+        return False, f"Error: HTTP {status_code} - {response_text}", []
         
     except Exception as e:
       return False, f"Error fetching replicas: {e}", []
@@ -51,7 +167,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/replicas/{replica_id}?verbose=true"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      response = self.session.request("GET", url)
       
       if response.status_code == 200:
         replica_data = response.json()
@@ -76,7 +192,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/replicas"
     
     try:
-      response = requests.request("POST", url, headers=self.headers, json=replica_data)
+      response = self.session.request("POST", url, json=replica_data)
       
       if response.status_code == 200:
         response_data = response.json()
@@ -100,7 +216,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/replicas/{replica_id}"
     
     try:
-      response = requests.request("DELETE", url, headers=self.headers)
+      response = self.session.request("DELETE", url)
       
       if response.status_code == 204:
         return True, "Successfully deleted replica"
@@ -125,7 +241,7 @@ class TavusAPIClient:
     payload = {"replica_name": new_name}
     
     try:
-      response = requests.request("PATCH", url, headers=self.headers, json=payload)
+      response = self.session.request("PATCH", url, json=payload)
       
       if response.status_code == 204:
         return True, "Successfully renamed replica"
@@ -148,19 +264,45 @@ class TavusAPIClient:
     url = f"{self.base_url}/personas?limit={limit}&persona_type={persona_type}"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      status_code, response_data, response_text = self._cached_get(url)
       
-      if response.status_code == 200:
-        response_data = response.json()
-        personas_data = response_data.get('data', [])
-        personas = [Persona.from_dict(persona_data) for persona_data in personas_data]
+      if status_code == 200:
+        personas = self._parse_list(url, response_data, Persona.from_dict, "persona_id")
         return True, f"Successfully fetched {len(personas)} persona(s)", personas
       else:
-        return False, f"Error: HTTP {response.status_code} - {response.text}", []
+        return False, f"Error: HTTP {status_code} - {response_text}", []
         
     except Exception as e:
       return False, f"Error fetching personas: {e}", []
   
+  def list_personas_page(self, persona_type: str, page: int, page_size: int) -> Tuple[bool, str, List[Persona], Optional[int]]:
+    """
+    List a single page of personas from Tavus API
+    
+    Args:
+      persona_type: Filter personas by type. Options: "user", "system".
+      page: The 1-based page number to return
+      page_size: The number of personas per page
+      
+    Returns:
+      Tuple[bool, str, List[Persona], Optional[int]]: (success, message, personas_list, total_count)
+        total_count is None when the API response does not report it
+    """
+    url = f"{self.base_url}/personas?limit={page_size}&page={page}&persona_type={persona_type}"
+    
+    try:
+      status_code, response_data, response_text = self._cached_get(url)
+      
+      if status_code == 200:
+        personas = self._parse_list(url, response_data, Persona.from_dict, "persona_id")
+        total_count = response_data.get('total_count')
+        return True, f"Successfully fetched {len(personas)} persona(s)", personas, total_count
+      else:
+        return False, f"Error: HTTP {status_code} - {response_text}", [], None
+        
+    except Exception as e:
+      return False, f"Error fetching personas: {e}", [], None
+  
   def create_persona(self, persona_data: Dict) -> Tuple[bool, str, Optional[Persona]]:
     """
     Create a new persona
@@ -174,7 +316,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/personas"
     
     try:
-      response = requests.request("POST", url, headers=self.headers, json=persona_data)
+      response = self.session.request("POST", url, json=persona_data)
       
       if response.status_code == 200:
         created_persona_data = response.json()
@@ -199,7 +341,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/personas/{persona_id}"
     
     try:
-      response = requests.request("DELETE", url, headers=self.headers)
+      response = self.session.request("DELETE", url)
       
       if response.status_code == 204:
         return True, "Successfully deleted persona"
@@ -223,7 +365,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/personas/{persona_id}"
     
     try:
-      response = requests.request("PATCH", url, headers=self.headers, json=patch_data)
+      response = self.session.request("PATCH", url, json=patch_data)
       
       if response.status_code == 200:
         return True, "Successfully updated persona"
@@ -246,7 +388,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/videos"
     
     try:
-      response = requests.request("POST", url, headers=self.headers, json=video_data)
+      response = self.session.request("POST", url, json=video_data)
       
       if response.status_code == 200:
         generated_video_data = response.json()
@@ -271,7 +413,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/videos/{video_id}"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      response = self.session.request("GET", url)
       
       if response.status_code == 200:
         video_data = response.json()
@@ -296,19 +438,46 @@ class TavusAPIClient:
     url = f"{self.base_url}/videos?limit={limit}"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      status_code, response_data, response_text = self._cached_get(url)
       
-      if response.status_code == 200:
-        response_data = response.json()
+      if status_code == 200:
         videos_data = response_data.get('data', [])
         videos = [Video.from_dict(video_data) for video_data in videos_data]
         return True, f"Successfully fetched {len(videos)} video(s)", videos
       else:
-        return False, f"Error: HTTP {response.status_code} - {response.text}", []
+        return False, f"Error: HTTP {status_code} - {response_text}", []
         
     except Exception as e:
       return False, f"Error fetching videos: {e}", []
 
+  def list_videos_page(self, page: int, page_size: int) -> Tuple[bool, str, List[Video], Optional[int]]:
+    """
+    List a single page of videos from Tavus API
+    
+    Args:
+      page: The 1-based page number to return
+      page_size: The number of videos per page
+      
+    Returns:
+      Tuple[bool, str, List[Video], Optional[int]]: (success, message, videos_list, total_count)
+        total_count is None when the API response does not report it
+    """
+    url = f"{self.base_url}/videos?limit={page_size}&page={page}"
+    
+    try:
+      status_code, response_data, response_text = self._cached_get(url)
+      
+      if status_code == 200:
+        videos_data = response_data.get('data', [])
+        videos = [Video.from_dict(video_data) for video_data in videos_data]
+        total_count = response_data.get('total_count')
+        return True, f"Successfully fetched {len(videos)} video(s)", videos, total_count
+      else:
+        return False, f"Error: HTTP {status_code} - {response_text}", [], None
+        
+    except Exception as e:
+      return False, f"Error fetching videos: {e}", [], None
+
   def delete_video(self, video_id: str) -> Tuple[bool, str]:
     """
     Delete a video by ID
@@ -322,7 +491,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/videos/{video_id}"
     
     try:
-      response = requests.request("DELETE", url, headers=self.headers)
+      response = self.session.request("DELETE", url)
       
       if response.status_code == 204:
         return True, "Successfully deleted video"
@@ -347,7 +516,7 @@ class TavusAPIClient:
     payload = {"video_name": new_name}
     
     try:
-      response = requests.request("PATCH", url, headers=self.headers, json=payload)
+      response = self.session.request("PATCH", url, json=payload)
       
       if response.status_code == 204:
         return True, "Successfully renamed video"
@@ -373,7 +542,7 @@ class TavusAPIClient:
       url += f"&status={status}"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      response = self.session.request("GET", url)
       
       if response.status_code == 200:
         response_data = response.json()
@@ -399,7 +568,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/conversations/{conversation_id}?verbose=true"
     
     try:
-      response = requests.request("GET", url, headers=self.headers)
+      response = self.session.request("GET", url)
       
       if response.status_code == 200:
         conversation_data = response.json()
@@ -426,7 +595,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/conversations"
     
     try:
-      response = requests.request("POST", url, headers=self.headers, json=conversation_data)
+      response = self.session.request("POST", url, json=conversation_data)
       
       if response.status_code == 200:
         created_conversation_data = response.json()
@@ -451,7 +620,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/conversations/{conversation_id}"
     
     try:
-      response = requests.request("DELETE", url, headers=self.headers)
+      response = self.session.request("DELETE", url)
       
       if response.status_code == 204:
         return True, "Successfully deleted conversation"
@@ -474,7 +643,7 @@ class TavusAPIClient:
     url = f"{self.base_url}/conversations/{conversation_id}/end"
     
     try:
-      response = requests.request("POST", url, headers=self.headers)
+      response = self.session.request("POST", url)
       
       if response.status_code == 200:
         return True, "Successfully ended conversation"
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Optional
+
+# Per-user cache directory, following the XDG convention
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "tavus")
+
+def _path(name: str) -> str:
+  """Return the file path used to store a named cache entry, e.g. "group/entry" """
+  return os.path.join(CACHE_DIR, f"{name}.json")
+
+def load(name: str) -> Optional[Any]:
+  """
+  Load a named cache entry from disk
+  
+  Args:
+    name: The cache entry name
+    
+  Returns:
+    Optional[Any]: The stored data, or None if missing or unreadable
+  """
+  try:
+    with open(_path(name), "r") as file:
+      return json.load(file)
+  except (OSError, ValueError):
+    return None
+
+def save(name: str, data: Any) -> None:
+  """
+  Atomically write a named cache entry to disk
+  
+  Cached responses belong to one account, so directories are created
+  readable by the current user only, and so is the file (mkstemp uses 0o600).
+  
+  Args:
+    name: The cache entry name
+    data: JSON-serializable data to store
+  """
+  path = _path(name)
+  try:
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    # A unique temp file, so concurrent saves never write into each other
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+  except OSError:
+    # The cache is only an optimization, so failing to write it is not an error
+    return
+  try:
+    with os.fdopen(fd, "w") as file:
+      json.dump(data, file)
+    # Replace in one step so a crash never leaves a half-written cache file
+    os.replace(tmp_path, path)
+  except (OSError, TypeError, ValueError):
+    try:
+      os.remove(tmp_path)
+    except OSError:
+      pass
+
+def clear(name: str) -> None:
+  """
+  Delete a named cache entry from disk
+  
+  Args:
+    name: The cache entry name
+  """
+  try:
+    os.remove(_path(name))
+  except OSError:
+    pass
+
+def clear_group(group: str) -> None:
+  """
+  Delete every cache entry stored under a group, i.e. named "group/..."
+  
+  Args:
+    group: The group name
+  """
+  shutil.rmtree(os.path.join(CACHE_DIR, group), ignore_errors=True)
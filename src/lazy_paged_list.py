@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+from typing import List, Callable, Dict, Any, Optional
+
+class LazyPagedList:
+    """Read-only sequence that fetches its items from the API one page at a time"""
+    
+    def __init__(self, fetch_page: Callable[[int], Optional[List[Any]]], page_size: int,
+                 total_count: int, first_page: List[Any] = None):
+        """
+        Args:
+            fetch_page: Callable taking a 0-based page index and returning that page's items,
+                or None if the fetch failed
+            page_size: Number of items the API returns per page
+            total_count: Total number of items reported by the API
+            first_page: Already-fetched items of page 0, if available
+        """
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.total_count = total_count
+        self._pages: Dict[int, List[Any]] = {}
+        if first_page is not None:
+            self._pages[0] = first_page
+    
+    def __len__(self) -> int:
+        return self.total_count
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            items = []
+            loaded = {}
+            for i in range(*index.indices(len(self))):
+                page, offset = divmod(i, self.page_size)
+                if page not in loaded:
+                    # A page that failed to load reads as empty for this call only
+                    loaded[page] = self._load_page(page) or []
+                page_items = loaded[page]
+                # The server may return a short page if items were removed meanwhile
+                if offset < len(page_items):
+                    items.append(page_items[offset])
+            return items
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyPagedList index out of range")
+        
+        page, offset = divmod(index, self.page_size)
+        page_items = self._load_page(page)
+        if page_items is None or offset >= len(page_items):
+            raise IndexError("LazyPagedList item could not be loaded")
+        return page_items[offset]
+    
+    def __iter__(self):
+        # Go page by page so missing items are skipped, as in slices
+        for start in range(0, len(self), self.page_size):
+            yield from self[start:start + self.page_size]
+    
+    def __delitem__(self, index: int):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyPagedList index out of range")
+        
+        page, offset = divmod(index, self.page_size)
+        page_items = self._load_page(page)
+        if page_items is None or offset >= len(page_items):
+            raise IndexError("LazyPagedList item could not be loaded")
+        self.total_count -= 1
+        # Later items shift back by one, into this page too, so drop every page from here on
+        for stale_page in [p for p in self._pages if p >= page]:
+            del self._pages[stale_page]
+    
+    def remove(self, item: Any):
+        """Remove an item from the loaded pages, refetching the pages after it on demand"""
+        for page in sorted(self._pages):
+            items = self._pages[page]
+            if item in items:
+                items.remove(item)
+                self.total_count -= 1
+                # Later items shift back by one, so drop every page from here on
+                for stale_page in [p for p in self._pages if p >= page]:
+                    del self._pages[stale_page]
+                return
+        raise ValueError("LazyPagedList.remove(x): x not in loaded pages")
+    
+    def _load_page(self, page: int) -> Optional[List[Any]]:
+        """Return the items of a page, fetching it on first access; None if the fetch failed"""
+        items = self._pages.get(page)
+        if items is None:
+            items = self.fetch_page(page)
+            # Leave a failed page uncached so the next access retries it
+            if items is not None:
+                self._pages[page] = items
+        return items
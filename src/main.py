@@ -3,7 +3,6 @@
 import os
 import click
 from bullet import Input
-from yaspin import yaspin
 
 from api_client import TavusAPIClient
 from state_machine_modular import StateMachineModular
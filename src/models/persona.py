@@ -6,6 +6,9 @@ from datetime import datetime
 class Persona:
   """Represents a Tavus Persona object"""
   
+  __slots__ = ('persona_id', 'persona_name', 'default_replica_id', 'created_at', 'updated_at',
+               'system_prompt', 'context', 'layers', '_short_cache')
+  
   def __init__(self, persona_id: str, persona_name: str, default_replica_id: str,
                created_at: str, updated_at: str, system_prompt: Optional[str] = None,
                context: Optional[str] = None, layers: Optional[Dict[str, Any]] = None):
@@ -17,6 +20,7 @@ class Persona:
     self.system_prompt = system_prompt
     self.context = context
     self.layers = layers or {}
+    self._short_cache = None
   
   @classmethod
   def from_dict(cls, data: dict) -> 'Persona':
@@ -100,9 +104,15 @@ class Persona:
     return self.context[:max_length] + "..."
   
   def display_short(self) -> str:
-    """Return a short one-line representation of the persona"""
-    replica_indicator = "🔗" if self.has_default_replica() else "🔴"
-    return f"{replica_indicator} {self.persona_name} ({self.persona_id}) - Default Replica: {self.default_replica_id or 'None'}"
+    """Return a short one-line representation of the persona (cached after first render)"""
+    if self._short_cache is None:
+      replica_indicator = "🔗" if self.has_default_replica() else "🔴"
+      self._short_cache = f"{replica_indicator} {self.persona_name} ({self.persona_id}) - Default Replica: {self.default_replica_id or 'None'}"
+    return self._short_cache
+  
+  def clear_display_cache(self):
+    """Drop cached display strings; call after mutating any displayed field"""
+    self._short_cache = None
   
   def display_verbose(self) -> str:
     """Return a verbose multi-line representation of the persona"""
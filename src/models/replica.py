@@ -1,23 +1,30 @@
 #!/usr/bin/env python3
 
+import sys
 from typing import Optional
 from datetime import datetime
 
 class Replica:
   """Represents a Tavus Replica object"""
   
+  __slots__ = ('replica_id', 'replica_name', 'replica_type', 'status', 'training_progress',
+               'created_at', 'updated_at', 'thumbnail_video_url', '_short_cache', '_verbose_cache')
+  
   def __init__(self, replica_id: str, replica_name: str, replica_type: str, 
                status: str, training_progress: str, 
                created_at: str, updated_at: str,
                thumbnail_video_url: Optional[str] = None):
     self.replica_id = replica_id
     self.replica_name = replica_name
-    self.replica_type = replica_type
+    # Only a handful of distinct types exist, so share one string object per type
+    self.replica_type = sys.intern(replica_type) if isinstance(replica_type, str) else replica_type
     self.status = status
     self.training_progress = training_progress
     self.created_at = created_at
     self.updated_at = updated_at
     self.thumbnail_video_url = thumbnail_video_url
+    self._short_cache = None
+    self._verbose_cache = None
   
   @classmethod
   def from_dict(cls, data: dict) -> 'Replica':
@@ -79,12 +86,25 @@ class Replica:
       return None
   
   def display_short(self) -> str:
-    """Return a short one-line representation of the replica"""
-    status_emoji = "✅" if self.is_completed() else "🔄" if self.is_training() else "❌"
-    return f"{status_emoji} {self.replica_name} ({self.replica_id}) - {self.status} - {self.training_progress}"
+    """Return a short one-line representation of the replica (cached after first render)"""
+    if self._short_cache is None:
+      status_emoji = "✅" if self.is_completed() else "🔄" if self.is_training() else "❌"
+      self._short_cache = f"{status_emoji} {self.replica_name} ({self.replica_id}) - {self.status} - {self.training_progress}"
+    return self._short_cache
   
   def display_verbose(self) -> str:
-    """Return a verbose multi-line representation of the replica"""
+    """Return a verbose multi-line representation of the replica (cached after first render)"""
+    if self._verbose_cache is None:
+      self._verbose_cache = self._render_verbose()
+    return self._verbose_cache
+  
+  def clear_display_cache(self):
+    """Drop cached display strings; call after mutating any displayed field"""
+    self._short_cache = None
+    self._verbose_cache = None
+  
+  def _render_verbose(self) -> str:
+    """Build the verbose multi-line representation of the replica"""
     lines = [
       f"Replica Details:",
       f"  ID: {self.replica_id}",
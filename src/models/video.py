@@ -6,6 +6,10 @@ from datetime import datetime
 class Video:
   """Represents a Tavus Video object"""
   
+  __slots__ = ('video_id', 'video_name', 'status', 'created_at', 'data', 'download_url',
+               'stream_url', 'hosted_url', 'status_details', 'updated_at',
+               'still_image_thumbnail_url', 'gif_thumbnail_url', '_short_cache', '_verbose_cache')
+  
   def __init__(self, video_id: str, video_name: str, status: str, created_at: str,
                data: Optional[Dict[str, Any]] = None, download_url: Optional[str] = None,
                stream_url: Optional[str] = None, hosted_url: Optional[str] = None,
@@ -23,6 +27,8 @@ class Video:
     self.updated_at = updated_at
     self.still_image_thumbnail_url = still_image_thumbnail_url
     self.gif_thumbnail_url = gif_thumbnail_url
+    self._short_cache = None
+    self._verbose_cache = None
   
   @classmethod
   def from_dict(cls, data: dict) -> 'Video':
@@ -115,12 +121,25 @@ class Video:
     return script[:max_length] + "..."
   
   def display_short(self) -> str:
-    """Return a short one-line representation of the video"""
-    status_emoji = "✅" if self.is_completed() else "🔄" if self.is_processing() else "❌" if self.is_failed() else "⏳"
-    return f"{status_emoji} {self.video_name} ({self.video_id}) - {self.status}"
+    """Return a short one-line representation of the video (cached after first render)"""
+    if self._short_cache is None:
+      status_emoji = "✅" if self.is_completed() else "🔄" if self.is_processing() else "❌" if self.is_failed() else "⏳"
+      self._short_cache = f"{status_emoji} {self.video_name} ({self.video_id}) - {self.status}"
+    return self._short_cache
   
   def display_verbose(self) -> str:
-    """Return a verbose multi-line representation of the video"""
+    """Return a verbose multi-line representation of the video (cached after first render)"""
+    if self._verbose_cache is None:
+      self._verbose_cache = self._render_verbose()
+    return self._verbose_cache
+  
+  def clear_display_cache(self):
+    """Drop cached display strings; call after mutating any displayed field"""
+    self._short_cache = None
+    self._verbose_cache = None
+  
+  def _render_verbose(self) -> str:
+    """Build the verbose multi-line representation of the video"""
     lines = [
       f"Video Details:",
       f"  ID: {self.video_id}",
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
+import sys
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Any
+from bullet import Bullet
+
+# Spinners only make sense on a terminal; piped or scripted runs skip them
+_INTERACTIVE = sys.stdout.isatty()
 
 # Common state constants to avoid hardcoding string literals
 class CommonStates:
@@ -9,9 +15,55 @@ class CommonStates:
     MAIN_MENU = "main_menu"
     EXIT = "exit"
 
+class _LazySpinner:
+    """Context manager that builds its yaspin spinner the first time it is entered"""
+    
+    def __init__(self, text: str):
+        self.text = text
+        self._spinner = None
+    
+    def __enter__(self):
+        if self._spinner is None:
+            # Imported on first use so startup and non-interactive runs never load yaspin
+            from yaspin import yaspin
+            self._spinner = yaspin(text=self.text)
+        return self._spinner.__enter__()
+    
+    def __exit__(self, *exc_info):
+        return self._spinner.__exit__(*exc_info)
+
+def spinner(text: str):
+    """Return a spinner for text, or a do-nothing context manager when stdout is not a terminal"""
+    if not _INTERACTIVE:
+        return nullcontext()
+    return _LazySpinner(text)
+
+class StaticMenu:
+    """Menu with fixed choices, built once, that maps the chosen entry to the next state"""
+    
+    def __init__(self, prompt: str, choice_to_state: Dict[str, str], default_state: str, bullet: str = "→"):
+        self.choice_to_state = choice_to_state
+        self.default_state = default_state
+        self.cli = Bullet(
+            prompt=prompt,
+            choices=list(choice_to_state),
+            bullet=bullet,
+            margin=2,
+            shift=0,
+        )
+    
+    def launch(self) -> str:
+        """Show the menu and return the state for the chosen entry"""
+        return self.choice_to_state.get(self.cli.launch(), self.default_state)
+
 class ModuleInterface(ABC):
     """Base interface for all state machine modules"""
     
+    # States handled by the module, mapped to their handler method names; used by execute_state
+    _STATE_HANDLERS: Dict[str, str] = {}
+    # Error of the last failed background fetch, kept until the module's screen shows it
+    _fetch_error: Optional[str] = None
+    
     @abstractmethod
     def get_name(self) -> str:
         """Return the module name"""
@@ -32,10 +84,22 @@ class ModuleInterface(ABC):
         """Return mapping from menu choices to states"""
         pass
     
-    @abstractmethod
     def execute_state(self, state: str, state_machine) -> str:
-        """Execute a specific state and return the next state"""
+        """Execute a specific state through its _STATE_HANDLERS method and return the next state"""
+        method_name = self._STATE_HANDLERS.get(state)
+        if method_name:
+            return getattr(self, method_name)(state_machine)
+        return CommonStates.MAIN_MENU
+    
+    def prefetch(self, state_machine) -> None:
+        """Start loading data in the background after a new API client is set; optional"""
         pass
+    
+    def _report_fetch_error(self) -> None:
+        """Print the error of the last failed background fetch, if any, and forget it"""
+        message, self._fetch_error = self._fetch_error, None
+        if message is not None:
+            print(message)
 
 class ModuleRegistry:
     """Registry for managing state machine modules"""
@@ -76,6 +140,11 @@ class ModuleRegistry:
         """Get all registered modules"""
         return self.modules.copy()
     
+    def prefetch(self, state_machine) -> None:
+        """Let every module start its background loads for the current API client"""
+        for module in self.modules.values():
+            module.prefetch(state_machine)
+    
     def get_all_states(self) -> List[str]:
         """Get all registered state names"""
         return list(self.state_handlers.keys()) 
\ No newline at end of file
@@ -1,15 +1,37 @@
 #!/usr/bin/env python3
 
-from bullet import Bullet, YesNo
-from yaspin import yaspin
-from . import ModuleInterface, CommonStates
-from paginated_list import PaginatedList, PaginatedListResult, PaginationAction
+import sys
+from . import ModuleInterface, CommonStates, StaticMenu, spinner
+from paginated_list import PaginatedList, PaginatedListResult, PaginationAction, _SEP60
 
 class ConversationModule(ModuleInterface):
     """Module for managing conversations"""
     
+    # States handled by this module, mapped to their handler method names
+    _STATE_HANDLERS = {
+        "work_with_conversations": "_execute_work_with_conversations",
+        "create_conversation": "_execute_create_conversation",
+        "list_conversations": "_execute_list_conversations",
+        "end_conversation": "_execute_end_conversation",
+        "delete_conversation": "_execute_delete_conversation",
+    }
+    
     def __init__(self):
         self.conversations = []
+        self._work_menu = StaticMenu(
+            "What would you like to do with Conversations?",
+            {
+                "Create a Conversation": "create_conversation",
+                "List Conversations": "list_conversations",
+                "End a Conversation": "end_conversation",
+                "Delete a Conversation": "delete_conversation",
+                "Back to Main Menu": CommonStates.MAIN_MENU,
+            },
+            default_state="work_with_conversations",
+            bullet="💬",
+        )
+        # Spinner shown on every visit, restarted rather than rebuilt
+        self._loading_spinner = spinner("Loading conversations...")
     
     def get_name(self) -> str:
         return "Conversation Management"
@@ -31,49 +53,16 @@ class ConversationModule(ModuleInterface):
             "Work with Conversations": "work_with_conversations"
         }
     
-    def execute_state(self, state: str, state_machine) -> str:
-        """Execute the given state and return the next state"""
-        if state == "work_with_conversations":
-            return self._execute_work_with_conversations(state_machine)
-        elif state == "create_conversation":
-            return self._execute_create_conversation(state_machine)
-        elif state == "list_conversations":
-            return self._execute_list_conversations(state_machine)
-        elif state == "end_conversation":
-            return self._execute_end_conversation(state_machine)
-        elif state == "delete_conversation":
-            return self._execute_delete_conversation(state_machine)
-        else:
-            return CommonStates.MAIN_MENU
-    
     def _execute_work_with_conversations(self, state_machine) -> str:
         """Execute work with conversations functionality and return next state"""
         print("\n=== Work with Conversations ===")
         
-        with yaspin(text="Loading conversations..."):
-            self._update_conversations(state_machine)
+        # Without a client there is nothing to load, so don't start the spinner thread
+        if state_machine.api_client is not None:
+            with self._loading_spinner:
+                self._update_conversations(state_machine)
 
-        cli = Bullet(
-            prompt="What would you like to do with Conversations?",
-            choices=["Create a Conversation", "List Conversations", "End a Conversation", "Delete a Conversation", "Back to Main Menu"],
-            bullet="💬",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        if result == "Create a Conversation":
-            return "create_conversation"
-        elif result == "List Conversations":
-            return "list_conversations"
-        elif result == "End a Conversation":
-            return "end_conversation"
-        elif result == "Delete a Conversation":
-            return "delete_conversation"
-        elif result == "Back to Main Menu":
-            return CommonStates.MAIN_MENU
-        else:
-            return "work_with_conversations"
+        return self._work_menu.launch()
     
     def _execute_create_conversation(self, state_machine) -> str:
         """Execute create conversation functionality and return next state"""
@@ -128,17 +117,23 @@ class ConversationModule(ModuleInterface):
             input("Press Enter to continue...")
             return "work_with_conversations"
         
+        # Re-show the same list until the user leaves
         paginated_list = PaginatedList(self.conversations, items_per_page)
-        paginated_list.set_page(page)
-        
-        result = paginated_list.show(
-            title="Conversations",
-            filter_type="all",
-            on_item_select=self._handle_conversation_select,
-            show_filter_option=False
-        )
-        
-        return self._handle_conversation_pagination_result(result, items_per_page, state_machine)
+        while True:
+            paginated_list.set_page(page)
+            result = paginated_list.show(
+                title="Conversations",
+                filter_type="all",
+                on_item_select=self._handle_conversation_select,
+                show_filter_option=False
+            )
+
+            if result.action in (PaginationAction.PREVIOUS_PAGE, PaginationAction.NEXT_PAGE):
+                page = result.data
+            elif result.action == PaginationAction.GO_BACK:
+                return "work_with_conversations"
+            else:
+                page = 0
     
     def _handle_conversation_select(self, conversation) -> PaginatedListResult:
         """Handle conversation selection from the list"""
@@ -146,21 +141,7 @@ class ConversationModule(ModuleInterface):
         input("Press Enter to continue...")
         return PaginatedListResult(PaginationAction.NO_ACTION)
     
-    def _handle_conversation_pagination_result(self, result, items_per_page, state_machine):
-        """Handle pagination result for conversations"""
-        if result.action == PaginationAction.PREVIOUS_PAGE:
-            return self._show_paginated_conversations(state_machine, result.data, items_per_page)
-        elif result.action == PaginationAction.NEXT_PAGE:
-            return self._show_paginated_conversations(state_machine, result.data, items_per_page)
-        elif result.action == PaginationAction.GO_BACK:
-            return "work_with_conversations"
-        else:
-            return self._show_paginated_conversations(state_machine, 0, items_per_page)
-    
     def _show_conversation_details(self, conversation):
         """Show detailed information about a conversation"""
-        print("\n" + "=" * 60)
-        print("CONVERSATION DETAILS")
-        print("=" * 60)
-        print(conversation.display_verbose())
-        print("=" * 60) 
\ No newline at end of file
+        sys.stdout.write(f"\n{_SEP60}CONVERSATION DETAILS\n{_SEP60}{conversation.display_verbose()}\n{_SEP60}")
+        sys.stdout.flush() 
\ No newline at end of file
@@ -1,18 +1,62 @@
 #!/usr/bin/env python3
 
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Sequence
 from bullet import Bullet, YesNo
-from yaspin import yaspin
-from . import ModuleInterface, CommonStates
-from models import Persona
-from paginated_list import PaginatedList, PaginatedListResult, PaginationAction, SectionedPaginatedList
+from . import ModuleInterface, CommonStates, StaticMenu, spinner
+from paginated_list import PaginatedList, PaginatedListResult, PaginationAction, _SEP60
 from paginated_replica_list import PaginatedReplicaList
+from lazy_paged_list import LazyPagedList
 
 class PersonaModule(ModuleInterface):
     """Module for handling persona management"""
     
+    # States handled by this module, mapped to their handler method names
+    _STATE_HANDLERS = {
+        "work_with_personas": "_execute_work_with_personas",
+        "create_persona": "_execute_create_persona",
+        "list_personas": "_execute_list_personas",
+        "delete_persona": "_execute_delete_persona",
+    }
+    
+    # Seconds a fetched list is reused before hitting the API again
+    PERSONAS_TTL = 30
+    # Personas are fetched from the API in pages of this size as the user browses
+    PERSONAS_PAGE_SIZE = 10
+    
     def __init__(self):
         self.personas = []  # Local storage for personas
         self.current_filter = "user"  # Default to user personas
+        self._personas_cache = {}  # (persona_type, api_key) -> (fetch time, personas)
+        # Background fetch started by prefetch(), consumed by the next visit; the
+        # filter menu also loads both persona types side by side on it
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._personas_future = None
+        self._filter_fetches = {}  # (persona_type, api_key) -> latest filter-menu fetch
+        self._work_menu = StaticMenu(
+            "What would you like to do with Personas?",
+            {
+                "Create a Persona": "create_persona",
+                "List Personas": "list_personas",
+                "Delete a Persona": "delete_persona",
+                "Back to Main Menu": CommonStates.MAIN_MENU,
+            },
+            default_state="work_with_personas",
+            bullet="👤",
+        )
+        # Widgets are built once and relaunched on every visit
+        self._loading_spinner = spinner("Loading personas...")
+        self._filter_cli = Bullet(
+            prompt="Select filter type:",
+            choices=["user", "system"],
+            bullet="→",
+            margin=2,
+            shift=0,
+        )
+        self._create_yesno = YesNo("Proceed with persona creation? ", default="n")
+        self._delete_yesno = YesNo("Are you sure you want to delete this persona?", default="n")
     
     def get_name(self) -> str:
         return "Persona Management"
@@ -33,43 +77,27 @@ class PersonaModule(ModuleInterface):
             "Work with Personas": "work_with_personas"
         }
     
-    def execute_state(self, state: str, state_machine) -> str:
-        if state == "work_with_personas":
-            return self._execute_work_with_personas(state_machine)
-        elif state == "create_persona":
-            return self._execute_create_persona(state_machine)
-        elif state == "list_personas":
-            return self._execute_list_personas(state_machine)
-        elif state == "delete_persona":
-            return self._execute_delete_persona(state_machine)
-        return CommonStates.MAIN_MENU
+    def prefetch(self, state_machine) -> None:
+        """Fetch user personas in the background while the user is still in the main menu"""
+        # A fetch still in flight will be picked up by the next visit as it is
+        if self._personas_future is not None and not self._personas_future.done():
+            return
+        self._personas_future = self._executor.submit(self._update_personas, state_machine)
     
     def _execute_work_with_personas(self, state_machine) -> str:
         """Execute work with personas menu and return next state"""
         print("\n=== Work with Personas ===")
         
-        with yaspin(text="Loading personas..."):
-            self._update_personas(state_machine)
-
-        cli = Bullet(
-            prompt="What would you like to do with Personas?",
-            choices=["Create a Persona", "List Personas", "Delete a Persona", "Back to Main Menu"],
-            bullet="👤",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        if result == "Create a Persona":
-            return "create_persona"
-        elif result == "List Personas":
-            return "list_personas"
-        elif result == "Delete a Persona":
-            return "delete_persona"
-        elif result == "Back to Main Menu":
-            return CommonStates.MAIN_MENU
+        # Without a client there is nothing to load, so don't start the spinner thread
+        if state_machine.api_client is None:
+            print("Error: API client not initialized. Please set your API key first.")
         else:
-            return "work_with_personas"
+            with self._loading_spinner:
+                self._wait_for_personas()
+                self._update_personas(state_machine)
+            self._report_fetch_error()
+
+        return self._work_menu.launch()
     
     def _execute_create_persona(self, state_machine) -> str:
         """Execute create persona functionality and return next state"""
@@ -110,8 +138,7 @@ class PersonaModule(ModuleInterface):
         print(f"  Default Replica: {default_replica_id or 'None'}")
         print("=" * 50)
         
-        cli = YesNo("Proceed with persona creation? ", default="n")
-        if not cli.launch():
+        if not self._create_yesno.launch():
             print("Persona creation cancelled.")
             input("Press Enter to continue...")
             return "work_with_personas"
@@ -128,10 +155,12 @@ class PersonaModule(ModuleInterface):
         if default_replica_id:
             persona_data["default_replica_id"] = default_replica_id
         
-        with yaspin(text="Creating persona..."):
+        with spinner("Creating persona..."):
             success, message, response_data = state_machine.api_client.create_persona(persona_data)
         
         if success:
+            # Make the next visit fetch the lists again so the new persona shows up
+            self._personas_cache.clear()
             print(f"\n✅ {message}")
             if response_data:
                 print(f"Persona ID: {response_data.persona_id}")
@@ -154,8 +183,10 @@ class PersonaModule(ModuleInterface):
             return CommonStates.MAIN_MENU
 
         # Fetch personas once when entering list view - default to user personas
-        with yaspin(text="Loading personas..."):
+        with self._loading_spinner:
+            self._wait_for_personas()
             self._update_personas(state_machine, persona_type="user")
+        self._report_fetch_error()
 
         return self._show_paginated_personas(state_machine, filter_type="user")
     
@@ -171,8 +202,10 @@ class PersonaModule(ModuleInterface):
         print("Only user personas can be deleted. System personas cannot be modified.")
         
         # Fetch user personas once for deletion
-        with yaspin(text="Loading user personas..."):
+        with spinner("Loading user personas..."):
+            self._wait_for_personas()
             self._update_personas(state_machine, persona_type="user")
+        self._report_fetch_error()
             
         return self._show_paginated_personas(state_machine, on_persona_select=self._handle_persona_delete, filter_type="user", show_filter_option=False)
     
@@ -198,19 +231,19 @@ class PersonaModule(ModuleInterface):
         print("WARNING: This action cannot be undone!")
         print("=" * 50)
         
-        cli = YesNo("Are you sure you want to delete this persona?", default="n")
-        if not cli.launch():
+        if not self._delete_yesno.launch():
             print("Delete operation cancelled.")
             input("Press Enter to continue...")
             return None  # Return to persona list
         
-        with yaspin(text="Deleting persona..."):
+        with spinner("Deleting persona..."):
             success, message = state_machine.api_client.delete_persona(persona.persona_id)
         
         if success:
             print(f"Persona deleted successfully: {persona.persona_name}")
-            # Remove the persona from our local list
-            self.personas = [p for p in self.personas if p.persona_id != persona.persona_id]
+            # Remove the persona from our local list (a LazyPagedList refetches the pages after it)
+            self.personas.remove(persona)
+            self._personas_cache.clear()
         else:
             print(f"Error deleting persona: {message}")
         
@@ -223,26 +256,56 @@ class PersonaModule(ModuleInterface):
             print("Error: API client not initialized. Please set your API key first.")
             return
 
-        success, message, fetched_personas = state_machine.api_client.list_personas(persona_type=persona_type)
-        if success:
+        fetched_personas = self._fetch_personas(state_machine, persona_type)
+        if fetched_personas is not None:
             self.personas = fetched_personas
+    
+    def _fetch_personas(self, state_machine, persona_type: str) -> Optional[Sequence[Any]]:
+        """Return personas of a type, from a recent fetch or the API; None if the fetch failed"""
+        # Capture the client and key together, before fetching, so results are cached under their account
+        api_client = state_machine.api_client
+        # Reuse a recent fetch of this type made with the same API key
+        key = (persona_type, state_machine.api_key)
+        cached = self._personas_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.PERSONAS_TTL:
+            return cached[1]
+
+        page_size = self.PERSONAS_PAGE_SIZE
+        success, message, first_page, total_count = api_client.list_personas_page(persona_type, 1, page_size)
+        if not success:
+            # May run on a background thread, so leave printing to the screen that waits for it
+            self._fetch_error = message
+            return None
+
+        if total_count is None:
+            # API did not report a total, so fall back to loading the full list
+            success, message, fetched_personas = api_client.list_personas(persona_type=persona_type)
+            if not success:
+                self._fetch_error = message
+                return None
         else:
-            print(message)
+            def fetch_page(page):
+                success, message, personas, _ = api_client.list_personas_page(persona_type, page + 1, page_size)
+                if not success:
+                    self._fetch_error = message
+                    return None
+                return personas
+
+            fetched_personas = LazyPagedList(fetch_page, page_size, total_count, first_page)
+        self._personas_cache[key] = (time.monotonic(), fetched_personas)
+        return fetched_personas
+    
+    def _wait_for_personas(self) -> None:
+        """Block until a background personas fetch, if any, has finished"""
+        if self._personas_future is not None:
+            self._personas_future.result()
+            self._personas_future = None
     
     def _show_paginated_personas(self, state_machine, page=0, items_per_page=10, filter_type=None, on_persona_select=None, show_filter_option=True):
         """Show paginated list of personas with selection"""
         # Use current filter if none specified
         if filter_type is None:
             filter_type = self.current_filter
-        
-        if not self.personas:
-            print(f"No {filter_type} personas found.")
-            input("Press Enter to continue...")
-            return "work_with_personas"
-
-        # Create paginated list
-        paginated_list = PaginatedList(self.personas, items_per_page)
-        paginated_list.set_page(page)
 
         def on_persona_select_wrapper(persona):
             if on_persona_select:
@@ -259,107 +322,91 @@ class PersonaModule(ModuleInterface):
                 # Return the current page so we stay on the same page
                 return PaginatedListResult(PaginationAction.NO_ACTION, paginated_list.get_current_page())
 
-        result = paginated_list.show(
-            title="Personas",
-            filter_type=filter_type,
-            on_item_select=on_persona_select_wrapper,
-            on_filter_change=self._handle_persona_filter_change,
-            show_filter_option=show_filter_option
-        )
+        # Re-show the list until the user leaves or a callback returns a state
+        paginated_list = None
+        while True:
+            if not self.personas:
+                print(f"No {filter_type} personas found.")
+                input("Press Enter to continue...")
+                return "work_with_personas"
+
+            # Create paginated list, again only when the personas were refetched for a new filter
+            if paginated_list is None or paginated_list.items is not self.personas:
+                paginated_list = PaginatedList(self.personas, items_per_page)
+            paginated_list.set_page(page)
+
+            result = paginated_list.show(
+                title="Personas",
+                filter_type=filter_type,
+                on_item_select=on_persona_select_wrapper,
+                on_filter_change=self._handle_persona_filter_change,
+                show_filter_option=show_filter_option
+            )
+            # A page that failed to load shows up empty; say why before the next page
+            self._report_fetch_error()
 
-        return self._handle_persona_pagination_result(result, items_per_page, filter_type, on_persona_select, show_filter_option, state_machine)
+            if result.action in (PaginationAction.PREVIOUS_PAGE, PaginationAction.NEXT_PAGE):
+                page = result.data
+            elif result.action == PaginationAction.GO_BACK:
+                return "work_with_personas"
+            elif result.action == PaginationAction.FILTER_CHANGED:
+                # Only plain browsing remembers the filter; selecting a persona for an action keeps it
+                filter_type = self._show_persona_filter_selection(state_machine, remember_filter=on_persona_select is None)
+                page = 0
+            elif result.action == PaginationAction.ITEM_SELECTED:
+                # Return the state from the custom callback
+                return result.data
+            else:
+                # Use the page from result.data if available, otherwise default to 0
+                page = result.data if result.data is not None else 0
     
     def _handle_persona_filter_change(self, filter_type):
         """Handle persona filter change"""
         return PaginatedListResult(PaginationAction.FILTER_CHANGED, filter_type)
 
-    def _handle_persona_pagination_result(self, result, items_per_page, filter_type, on_persona_select, show_filter_option, state_machine):
-        """Handle pagination result for personas"""
-        if result.action == PaginationAction.PREVIOUS_PAGE:
-            return self._show_paginated_personas(state_machine, result.data, items_per_page, filter_type, on_persona_select, show_filter_option)
-        elif result.action == PaginationAction.NEXT_PAGE:
-            return self._show_paginated_personas(state_machine, result.data, items_per_page, filter_type, on_persona_select, show_filter_option)
-        elif result.action == PaginationAction.GO_BACK:
-            return "work_with_personas"
-        elif result.action == PaginationAction.FILTER_CHANGED:
-            # Handle filter change while preserving the callback
-            return self._show_persona_filter_selection_with_callback(on_persona_select, state_machine)
-        elif result.action == PaginationAction.ITEM_SELECTED:
-            # Return the state from the custom callback
-            return result.data
-        else:
-            # Use the page from result.data if available, otherwise default to 0
-            current_page = result.data if result.data is not None else 0
-            return self._show_paginated_personas(state_machine, current_page, items_per_page, filter_type, on_persona_select, show_filter_option)
-
-    def _show_persona_filter_selection_with_callback(self, on_persona_select=None, state_machine=None):
-        """Show filter selection for personas with optional callback preservation"""
+    def _show_persona_filter_selection(self, state_machine, remember_filter=True) -> str:
+        """Show filter selection for personas, load personas of the chosen type and return it"""
         print("\n=== Filter Personas ===")
         
-        # If we have a callback, preserve it through filter selection
-        if on_persona_select:
-            cli = Bullet(
-                prompt="Select filter type:",
-                choices=["user", "system"],
-                bullet="→",
-                margin=2,
-                shift=0,
-            )
-            result = cli.launch()
-
-            if result == "user":
-                # Fetch user personas for the new filter
-                with yaspin(text="Loading user personas..."):
-                    self._update_personas(state_machine, persona_type="user")
-                return self._show_paginated_personas(state_machine, filter_type="user", on_persona_select=on_persona_select, show_filter_option=True)
-            elif result == "system":
-                # Fetch system personas for the new filter
-                with yaspin(text="Loading system personas..."):
-                    self._update_personas(state_machine, persona_type="system")
-                return self._show_paginated_personas(state_machine, filter_type="system", on_persona_select=on_persona_select, show_filter_option=True)
-        else:
-            # Standard filter selection for normal browsing
-            cli = Bullet(
-                prompt="Select filter type:",
-                choices=["user", "system"],
-                bullet="→",
-                margin=2,
-                shift=0,
-            )
-            result = cli.launch()
-
-            if result == "user":
-                # Fetch user personas for the new filter
-                with yaspin(text="Loading user personas..."):
-                    self._update_personas(state_machine, persona_type="user")
-                self.current_filter = "user"
-                return self._show_paginated_personas(state_machine, filter_type="user", show_filter_option=True)
-            elif result == "system":
-                # Fetch system personas for the new filter
-                with yaspin(text="Loading system personas..."):
-                    self._update_personas(state_machine, persona_type="system")
-                self.current_filter = "system"
-                return self._show_paginated_personas(state_machine, filter_type="system", show_filter_option=True)
+        # Load both types while the user decides, so the chosen one is usually ready;
+        # a type whose earlier fetch is still running is left to finish
+        fetches = {}
+        if state_machine.api_client is not None:
+            self._wait_for_personas()
+            for persona_type in ("user", "system"):
+                key = (persona_type, state_machine.api_key)
+                future = self._filter_fetches.get(key)
+                if future is None or future.done():
+                    future = self._executor.submit(self._fetch_personas, state_machine, persona_type)
+                    self._filter_fetches[key] = future
+                fetches[persona_type] = future
         
-        # Default fallback
-        with yaspin(text="Loading user personas..."):
-            self._update_personas(state_machine, persona_type="user")
-        self.current_filter = "user"
-        return self._show_paginated_personas(state_machine, filter_type="user", show_filter_option=True)
+        result = self._filter_cli.launch()
+        filter_type = result if result in ("user", "system") else "user"
+
+        # Fetch personas for the new filter
+        with spinner(f"Loading {filter_type} personas..."):
+            if filter_type in fetches:
+                fetched_personas = fetches[filter_type].result()
+                if fetched_personas is not None:
+                    self.personas = fetched_personas
+            else:
+                self._update_personas(state_machine, persona_type=filter_type)
+        self._report_fetch_error()
+        if remember_filter:
+            self.current_filter = filter_type
+        return filter_type
     
     def _show_persona_details(self, persona):
         """Show detailed information for a specific persona"""
-        print("\n" + "=" * 60)
-        print("PERSONA DETAILS")
-        print("=" * 60)
-        print(persona.display_verbose())
-        print("=" * 60)
+        sys.stdout.write(f"\n{_SEP60}PERSONA DETAILS\n{_SEP60}{persona.display_verbose()}\n{_SEP60}")
+        sys.stdout.flush()
     
     def _show_paginated_replicas_for_selection(self, state_machine, page=0, filter_type="all"):
         """Show paginated list of replicas for selection and return the selected replica ID"""
         # Update replicas if needed
         if not hasattr(self, 'replicas') or not self.replicas:
-            with yaspin(text="Loading replicas..."):
+            with spinner("Loading replicas..."):
                 self._update_replicas_for_selection(state_machine)
         
         if not hasattr(self, 'replicas') or not self.replicas:
@@ -1,15 +1,54 @@
 #!/usr/bin/env python3
 
-from bullet import Bullet, YesNo
-from yaspin import yaspin
-from . import ModuleInterface, CommonStates
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from bullet import YesNo
+from . import ModuleInterface, CommonStates, StaticMenu, spinner
+from paginated_list import _SEP60
 from paginated_replica_list import PaginatedReplicaList
 
 class ReplicaModule(ModuleInterface):
     """Module for managing replicas"""
     
+    # States handled by this module, mapped to their handler method names
+    _STATE_HANDLERS = {
+        "work_with_replicas": "_execute_work_with_replicas",
+        "create_replica": "_execute_create_replica",
+        "list_replicas": "_execute_list_replicas",
+        "rename_replica": "_execute_rename_replica",
+        "delete_replica": "_execute_delete_replica",
+    }
+    
+    # Seconds a fetched list is reused before hitting the API again
+    REPLICAS_TTL = 30
+    
     def __init__(self):
         self.replicas = []
+        self._paginated_replicas = None
+        self._replicas_cache_ts = 0
+        self._replicas_api_key = None  # API key the cached replicas were fetched with
+        # Background fetch started by prefetch(), consumed by the next visit
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._replicas_future = None
+        
+        # Widgets are built once and relaunched on every visit
+        self._work_menu = StaticMenu(
+            "What would you like to do with Replicas?",
+            {
+                "Create a Replica": "create_replica",
+                "List Replicas": "list_replicas",
+                "Rename a Replica": "rename_replica",
+                "Delete a Replica": "delete_replica",
+                "Back to Main Menu": CommonStates.MAIN_MENU,
+            },
+            default_state="work_with_replicas",
+            bullet="🧑",
+        )
+        self._create_yesno = YesNo("Proceed with replica creation? ", default="n")
+        self._rename_yesno = YesNo("Are you sure you want to rename this replica?", default="n")
+        self._delete_yesno = YesNo("Are you sure you want to delete this replica?", default="n")
+        self._loading_spinner = spinner("Loading replicas...")
     
     def get_name(self) -> str:
         return "Replica Management"
@@ -31,49 +70,27 @@ class ReplicaModule(ModuleInterface):
             "Work with Replicas": "work_with_replicas"
         }
     
-    def execute_state(self, state: str, state_machine) -> str:
-        """Execute the given state and return the next state"""
-        if state == "work_with_replicas":
-            return self._execute_work_with_replicas(state_machine)
-        elif state == "create_replica":
-            return self._execute_create_replica(state_machine)
-        elif state == "list_replicas":
-            return self._execute_list_replicas(state_machine)
-        elif state == "rename_replica":
-            return self._execute_rename_replica(state_machine)
-        elif state == "delete_replica":
-            return self._execute_delete_replica(state_machine)
-        else:
-            return CommonStates.MAIN_MENU
+    def prefetch(self, state_machine) -> None:
+        """Fetch replicas in the background while the user is still in the main menu"""
+        # A fetch still in flight will be picked up by the next visit as it is
+        if self._replicas_future is not None and not self._replicas_future.done():
+            return
+        self._replicas_future = self._executor.submit(self._update_replicas, state_machine)
     
     def _execute_work_with_replicas(self, state_machine) -> str:
         """Execute work with replicas functionality and return next state"""
         print("\n=== Work with Replicas ===")
         
-        with yaspin(text="Loading replicas..."):
-            self._update_replicas(state_machine)
-
-        cli = Bullet(
-            prompt="What would you like to do with Replicas?",
-            choices=["Create a Replica", "List Replicas", "Rename a Replica", "Delete a Replica", "Back to Main Menu"],
-            bullet="🧑",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        if result == "Create a Replica":
-            return "create_replica"
-        elif result == "List Replicas":
-            return "list_replicas"
-        elif result == "Rename a Replica":
-            return "rename_replica"
-        elif result == "Delete a Replica":
-            return "delete_replica"
-        elif result == "Back to Main Menu":
-            return CommonStates.MAIN_MENU
+        # Without a client there is nothing to load, so don't start the spinner thread
+        if state_machine.api_client is None:
+            print("Error: API client not initialized. Please set your API key first.")
         else:
-            return "work_with_replicas"
+            with self._loading_spinner:
+                self._wait_for_replicas()
+                self._update_replicas(state_machine)
+            self._report_fetch_error()
+
+        return self._work_menu.launch()
     
     def _execute_create_replica(self, state_machine) -> str:
         """Execute create replica functionality and return next state"""
@@ -112,8 +129,7 @@ class ReplicaModule(ModuleInterface):
         print(f"  Consent Video URL: {consent_video_url}")
         print("=" * 50)
         
-        cli = YesNo("Proceed with replica creation? ", default="n")
-        if not cli.launch():
+        if not self._create_yesno.launch():
             print("Replica creation cancelled.")
             input("Press Enter to continue...")
             return "work_with_replicas"
@@ -125,10 +141,12 @@ class ReplicaModule(ModuleInterface):
             "consent_video_url": consent_video_url
         }
         
-        with yaspin(text="Creating replica..."):
+        with spinner("Creating replica..."):
             success, message, response_data = state_machine.api_client.create_replica(replica_data)
         
         if success:
+            # Make the next visit fetch the list again so the new replica shows up
+            self._replicas_cache_ts = 0
             print(f"\n✅ {message}")
             if response_data:
                 print(f"Replica ID: {response_data.get('replica_id', 'N/A')}")
@@ -211,19 +229,21 @@ class ReplicaModule(ModuleInterface):
         print(f"  To:   {new_name}")
         print("=" * 50)
         
-        cli = YesNo("Are you sure you want to rename this replica?", default="n")
-        if not cli.launch():
+        if not self._rename_yesno.launch():
             print("Rename operation cancelled.")
             input("Press Enter to continue...")
             return "work_with_replicas"  # Return to replica list
         
-        with yaspin(text="Renaming replica..."):
+        with spinner("Renaming replica..."):
             success, message = state_machine.api_client.rename_replica(replica.replica_id, new_name)
         
         if success:
             print(f"Replica renamed successfully to: {new_name}")
             # Update the replica object in our list
             replica.replica_name = new_name
+            replica.clear_display_cache()
+            if self._paginated_replicas is not None:
+                self._paginated_replicas.clear_choices_cache()
         else:
             print(f"Error renaming replica: {message}")
         
@@ -260,19 +280,21 @@ class ReplicaModule(ModuleInterface):
         print("WARNING: This action cannot be undone!")
         print("=" * 50)
         
-        cli = YesNo("Are you sure you want to delete this replica?", default="n")
-        if not cli.launch():
+        if not self._delete_yesno.launch():
             print("Delete operation cancelled.")
             input("Press Enter to continue...")
             return "work_with_replicas"  # Return to replica list
         
-        with yaspin(text="Deleting replica..."):
+        with spinner("Deleting replica..."):
             success, message = state_machine.api_client.delete_replica(replica.replica_id)
         
         if success:
             print(f"Replica deleted successfully: {replica.replica_name}")
-            # Remove the replica from our local list
-            self.replicas = [r for r in self.replicas if r.replica_id != replica.replica_id]
+            # Remove the replica from our local list and the paginated view built on it
+            if self._paginated_replicas is not None and self._paginated_replicas.replicas is self.replicas:
+                self._paginated_replicas.remove_replica(replica)
+            else:
+                self.replicas = [r for r in self.replicas if r.replica_id != replica.replica_id]
         else:
             print(f"Error deleting replica: {message}")
         
@@ -281,16 +303,37 @@ class ReplicaModule(ModuleInterface):
     
     def _update_replicas(self, state_machine) -> None:
         """Update the replicas list from API"""
-        if state_machine.api_client is None:
+        # Capture the client and key before fetching, so a key set meanwhile cannot tag this data
+        api_client = state_machine.api_client
+        api_key = state_machine.api_key
+        if api_client is None:
             print("Error: API client not initialized. Please set your API key first.")
             return
 
-        success, message, fetched_replicas = state_machine.api_client.list_replicas()
+        # Reuse a recent fetch unless the API key has changed since
+        if (self._replicas_api_key == api_key
+                and time.monotonic() - self._replicas_cache_ts < self.REPLICAS_TTL):
+            return
+
+        success, message, fetched_replicas = api_client.list_replicas()
         if success:
-            # Convert dictionary data to Replica objects
-            self.replicas = fetched_replicas
+            # An unchanged response hands back the same Replica objects; keeping the
+            # current list then also keeps the paginated view built on it
+            # (compared by identity, since Replica equality only looks at the id)
+            if (len(fetched_replicas) != len(self.replicas)
+                    or any(a is not b for a, b in zip(fetched_replicas, self.replicas))):
+                self.replicas = fetched_replicas
+            self._replicas_cache_ts = time.monotonic()
+            self._replicas_api_key = api_key
         else:
-            print(message)
+            # May run on a background thread, so leave printing to the screen that waits for it
+            self._fetch_error = message
+    
+    def _wait_for_replicas(self) -> None:
+        """Block until a background replicas fetch, if any, has finished"""
+        if self._replicas_future is not None:
+            self._replicas_future.result()
+            self._replicas_future = None
     
     def _show_paginated_replicas(self, state_machine, page=0, items_per_page=10, filter_type="all", on_replica_select=None, show_filter_option=True):
         """Show paginated list of replicas with selection using the generic class"""
@@ -300,7 +343,7 @@ class ReplicaModule(ModuleInterface):
             return "work_with_replicas"
 
         # Use the generic paginated replica list
-        paginated_list = PaginatedReplicaList(self.replicas, items_per_page)
+        paginated_list = self._get_paginated_replicas(items_per_page)
         result = paginated_list.show(
             state_machine=state_machine,
             page=page,
@@ -318,10 +361,16 @@ class ReplicaModule(ModuleInterface):
         else:
             return "work_with_replicas"
     
+    def _get_paginated_replicas(self, items_per_page):
+        """Return a paginated list for the current replicas, rebuilt only when the list is replaced"""
+        paginated_list = self._paginated_replicas
+        if (paginated_list is None or paginated_list.replicas is not self.replicas
+                or paginated_list.items_per_page != items_per_page):
+            paginated_list = PaginatedReplicaList(self.replicas, items_per_page)
+            self._paginated_replicas = paginated_list
+        return paginated_list
+    
     def _show_replica_details(self, replica):
         """Show detailed information for a specific replica"""
-        print("\n" + "=" * 60)
-        print("REPLICA DETAILS")
-        print("=" * 60)
-        print(replica.display_verbose())
-        print("=" * 60) 
\ No newline at end of file
+        sys.stdout.write(f"\n{_SEP60}REPLICA DETAILS\n{_SEP60}{replica.display_verbose()}\n{_SEP60}")
+        sys.stdout.flush() 
\ No newline at end of file
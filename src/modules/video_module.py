@@ -1,18 +1,65 @@
 #!/usr/bin/env python3
 
-from bullet import Bullet, YesNo
-from yaspin import yaspin
-from . import ModuleInterface, CommonStates
-from models import Video
-from paginated_list import PaginatedList, PaginatedListResult, PaginationAction, SectionedPaginatedList
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from bullet import YesNo
+from . import ModuleInterface, CommonStates, StaticMenu, spinner
+from paginated_list import PaginatedList, PaginatedListResult, PaginationAction, _SEP60
 from paginated_replica_list import PaginatedReplicaList
+from lazy_paged_list import LazyPagedList
 
 class VideoModule(ModuleInterface):
     """Module for handling video management"""
     
+    # States handled by this module, mapped to their handler method names
+    _STATE_HANDLERS = {
+        "work_with_videos": "_execute_work_with_videos",
+        "generate_video": "_execute_generate_video",
+        "list_videos": "_execute_list_videos",
+        "rename_video": "_execute_rename_video",
+        "delete_video": "_execute_delete_video",
+        "refresh_videos": "_execute_refresh_videos",
+        "clear_video_cache": "_execute_clear_video_cache",
+    }
+    
+    # Seconds a fetched list is reused before hitting the API again
+    VIDEOS_TTL = 30
+    REPLICAS_TTL = 30
+    # Videos are fetched from the API in pages of this size as the user browses
+    VIDEOS_PAGE_SIZE = 10
+    
     def __init__(self):
         self.videos = []  # Local storage for videos
         self.replicas = []  # Local storage for replicas (needed for video creation)
+        self._videos_cache_ts = 0
+        self._replicas_cache_ts = 0
+        self._videos_api_key = None  # API key the cached videos were fetched with
+        self._replicas_api_key = None  # API key the cached replicas were fetched with
+        self._replica_selection_list = None  # Partitioned view of self.replicas, reused until refetch
+        # Background fetches overlapping network I/O with the user reading menus or typing
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._videos_future = None
+        self._replicas_future = None
+        
+        # Widgets are built once and relaunched on every visit
+        self._work_menu = StaticMenu(
+            "What would you like to do with Videos?",
+            {
+                "Generate a Video": "generate_video",
+                "List Videos": "list_videos",
+                "Rename a Video": "rename_video",
+                "Delete a Video": "delete_video",
+                "Refresh Videos": "refresh_videos",
+                "Clear Cache": "clear_video_cache",
+                "Back to Main Menu": CommonStates.MAIN_MENU,
+            },
+            default_state="work_with_videos",
+            bullet="🎬",
+        )
+        self._generate_yesno = YesNo("Proceed with video generation? ", default="n")
+        self._rename_yesno = YesNo("Are you sure you want to rename this video?", default="n")
+        self._delete_yesno = YesNo("Are you sure you want to delete this video?", default="n")
     
     def get_name(self) -> str:
         return "Video Management"
@@ -23,7 +70,9 @@ class VideoModule(ModuleInterface):
             "generate_video",
             "list_videos",
             "rename_video",
-            "delete_video"
+            "delete_video",
+            "refresh_videos",
+            "clear_video_cache"
         ]
     
     def get_menu_options(self) -> list:
@@ -34,47 +83,40 @@ class VideoModule(ModuleInterface):
             "Work with Videos": "work_with_videos"
         }
     
-    def execute_state(self, state: str, state_machine) -> str:
-        if state == "work_with_videos":
-            return self._execute_work_with_videos(state_machine)
-        elif state == "generate_video":
-            return self._execute_generate_video(state_machine)
-        elif state == "list_videos":
-            return self._execute_list_videos(state_machine)
-        elif state == "rename_video":
-            return self._execute_rename_video(state_machine)
-        elif state == "delete_video":
-            return self._execute_delete_video(state_machine)
-        return CommonStates.MAIN_MENU
+    def prefetch(self, state_machine) -> None:
+        """Fetch videos in the background while the user is still in the main menu"""
+        # A fetch still in flight will be picked up by the next visit as it is
+        if self._videos_future is not None and not self._videos_future.done():
+            return
+        self._videos_future = self._executor.submit(self._update_videos, state_machine)
     
     def _execute_work_with_videos(self, state_machine) -> str:
         """Execute work with videos menu and return next state"""
         print("\n=== Work with Videos ===")
         
-        with yaspin(text="Loading videos..."):
-            self._update_videos(state_machine)
+        # Load videos in the background while the user picks an action
+        self._wait_for_videos()
+        self._report_fetch_error()
+        if state_machine.api_client is not None:
+            self._videos_future = self._executor.submit(self._update_videos, state_machine)
 
-        cli = Bullet(
-            prompt="What would you like to do with Videos?",
-            choices=["Generate a Video", "List Videos", "Rename a Video", "Delete a Video", "Back to Main Menu"],
-            bullet="🎬",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        if result == "Generate a Video":
-            return "generate_video"
-        elif result == "List Videos":
-            return "list_videos"
-        elif result == "Rename a Video":
-            return "rename_video"
-        elif result == "Delete a Video":
-            return "delete_video"
-        elif result == "Back to Main Menu":
-            return CommonStates.MAIN_MENU
-        else:
-            return "work_with_videos"
+        return self._work_menu.launch()
+    
+    def _execute_refresh_videos(self, state_machine) -> str:
+        """Expire the cached videos so the menu reloads them from the API"""
+        self._wait_for_videos()
+        self._videos_cache_ts = 0
+        return "work_with_videos"
+    
+    def _execute_clear_video_cache(self, state_machine) -> str:
+        """Drop the on-disk responses as well so the next load is a full fetch"""
+        self._wait_for_videos()
+        if state_machine.api_client is not None:
+            state_machine.api_client.clear_response_cache()
+        self._videos_cache_ts = 0
+        self._replicas_cache_ts = 0
+        print("✅ Cache cleared")
+        return "work_with_videos"
     
     def _execute_generate_video(self, state_machine) -> str:
         """Execute generate video functionality and return next state"""
@@ -84,6 +126,10 @@ class VideoModule(ModuleInterface):
             print("Error: API client not initialized. Please set your API key first.")
             return CommonStates.MAIN_MENU
 
+        # Start loading replicas now so they arrive while the user types the name
+        if self._replicas_stale(state_machine):
+            self._replicas_future = self._executor.submit(self._update_replicas_for_selection, state_machine)
+
         # Collect video generation parameters
         video_name = input("Video Name: ")
         
@@ -94,6 +140,7 @@ class VideoModule(ModuleInterface):
 
         # Select replica from paginated list
         print("Select a replica for this video:")
+        self._wait_for_replicas()
         replica_selection_result = self._show_paginated_replicas_for_selection(state_machine)
         if replica_selection_result is None:
             print("Replica selection cancelled.")
@@ -116,8 +163,7 @@ class VideoModule(ModuleInterface):
         print(f"  Script: {script[:100]}{'...' if len(script) > 100 else ''}")
         print("=" * 50)
         
-        cli = YesNo("Proceed with video generation? ", default="n")
-        if not cli.launch():
+        if not self._generate_yesno.launch():
             print("Video generation cancelled.")
             input("Press Enter to continue...")
             return "work_with_videos"
@@ -129,10 +175,12 @@ class VideoModule(ModuleInterface):
             "script": script
         }
         
-        with yaspin(text="Generating video..."):
+        with spinner("Generating video..."):
             success, message, response_data = state_machine.api_client.generate_video(video_data)
         
         if success:
+            # Make the next visit fetch the list again so the new video shows up
+            self._videos_cache_ts = 0
             print(f"\n✅ {message}")
             if response_data:
                 print(f"Video ID: {response_data.video_id}")
@@ -179,7 +227,7 @@ class VideoModule(ModuleInterface):
 
         return self._show_paginated_videos(state_machine, on_video_select=self._handle_video_delete)
     
-    def _handle_video_rename(self, video, state_machine) -> str:
+    def _handle_video_rename(self, video, index, state_machine) -> str:
         """Handle video rename when a video is selected from the list"""
         print(f"\nRenaming video: {video.video_name} ({video.video_id})")
         print("=" * 50)
@@ -206,26 +254,26 @@ class VideoModule(ModuleInterface):
         print(f"  To:   {new_name}")
         print("=" * 50)
         
-        cli = YesNo("Are you sure you want to rename this video?", default="n")
-        if not cli.launch():
+        if not self._rename_yesno.launch():
             print("Rename operation cancelled.")
             input("Press Enter to continue...")
             return None  # Return to video list
         
-        with yaspin(text="Renaming video..."):
+        with spinner("Renaming video..."):
             success, message = state_machine.api_client.rename_video(video.video_id, new_name)
         
         if success:
             print(f"Video renamed successfully to: {new_name}")
             # Update the video object in our list
             video.video_name = new_name
+            video.clear_display_cache()
         else:
             print(f"Error renaming video: {message}")
         
         input("Press Enter to continue...")
         return "work_with_videos"
     
-    def _handle_video_delete(self, video, state_machine) -> str:
+    def _handle_video_delete(self, video, index, state_machine) -> str:
         """Handle video delete when a video is selected from the list"""
         print(f"\nDeleting video: {video.video_name} ({video.video_id})")
         print("=" * 50)
@@ -248,19 +296,19 @@ class VideoModule(ModuleInterface):
         print("WARNING: This action cannot be undone!")
         print("=" * 50)
         
-        cli = YesNo("Are you sure you want to delete this video?", default="n")
-        if not cli.launch():
+        if not self._delete_yesno.launch():
             print("Delete operation cancelled.")
             input("Press Enter to continue...")
             return None  # Return to video list
         
-        with yaspin(text="Deleting video..."):
+        with spinner("Deleting video..."):
             success, message = state_machine.api_client.delete_video(video.video_id)
         
         if success:
             print(f"Video deleted successfully: {video.video_name}")
-            # Remove the video from our local list
-            self.videos.remove(video)
+            # Remove the video from our local list by position rather than searching for it
+            del self.videos[index]
+            self._videos_cache_ts = 0
         else:
             print(f"Error deleting video: {message}")
         
@@ -269,18 +317,54 @@ class VideoModule(ModuleInterface):
     
     def _update_videos(self, state_machine) -> None:
         """Update the videos list from API"""
-        if state_machine.api_client is None:
+        # Capture the client and key before fetching, so data is tagged with the account it came from
+        api_client = state_machine.api_client
+        api_key = state_machine.api_key
+        if api_client is None:
             print("Error: API client not initialized. Please set your API key first.")
             return
 
-        success, message, fetched_videos = state_machine.api_client.list_videos()
-        if success:
+        if (self.videos and self._videos_api_key == api_key
+                and time.monotonic() - self._videos_cache_ts < self.VIDEOS_TTL):
+            return
+
+        page_size = self.VIDEOS_PAGE_SIZE
+        success, message, first_page, total_count = api_client.list_videos_page(1, page_size)
+        if not success:
+            # Runs on a background thread, so leave printing to the screen that waits for it
+            self._fetch_error = message
+            return
+
+        if total_count is None:
+            # API did not report a total, so fall back to loading the full list
+            success, message, fetched_videos = api_client.list_videos()
+            if not success:
+                self._fetch_error = message
+                return
             self.videos = fetched_videos
         else:
-            print(message)
+            def fetch_page(page):
+                success, message, videos, _ = api_client.list_videos_page(page + 1, page_size)
+                if not success:
+                    self._fetch_error = message
+                    return None
+                return videos
+
+            self.videos = LazyPagedList(fetch_page, page_size, total_count, first_page)
+        self._videos_cache_ts = time.monotonic()
+        self._videos_api_key = api_key
+    
+    def _wait_for_videos(self) -> None:
+        """Block until a background videos fetch, if any, has finished"""
+        if self._videos_future is not None:
+            with spinner("Loading videos..."):
+                self._videos_future.result()
+            self._videos_future = None
     
     def _show_paginated_videos(self, state_machine, page=0, items_per_page=10, on_video_select=None):
         """Show paginated list of videos with selection"""
+        self._wait_for_videos()
+        self._report_fetch_error()
         if not self.videos:
             print("No videos found.")
             input("Press Enter to continue...")
@@ -288,12 +372,11 @@ class VideoModule(ModuleInterface):
 
         # Create paginated list
         paginated_list = PaginatedList(self.videos, items_per_page)
-        paginated_list.set_page(page)
 
         def on_video_select_wrapper(video):
             if on_video_select:
                 # Call the custom callback function
-                result_state = on_video_select(video, state_machine)
+                result_state = on_video_select(video, paginated_list.selected_index, state_machine)
                 if result_state:
                     return PaginatedListResult(PaginationAction.ITEM_SELECTED, result_state)
                 # If callback returns None, continue showing the list
@@ -305,52 +388,52 @@ class VideoModule(ModuleInterface):
                 # Return the current page so we stay on the same page
                 return PaginatedListResult(PaginationAction.NO_ACTION, paginated_list.get_current_page())
 
-        result = paginated_list.show(
-            title="Videos",
-            on_item_select=on_video_select_wrapper,
-            show_filter_option=False
-        )
+        # Re-show the same list until the user leaves or a callback returns a state
+        while True:
+            paginated_list.set_page(page)
+            result = paginated_list.show(
+                title="Videos",
+                on_item_select=on_video_select_wrapper,
+                show_filter_option=False
+            )
+            # A page that failed to load shows up empty; say why before the next page
+            self._report_fetch_error()
 
-        return self._handle_video_pagination_result(result, items_per_page, on_video_select, state_machine)
-    
-    def _handle_video_pagination_result(self, result, items_per_page, on_video_select, state_machine):
-        """Handle pagination result for videos"""
-        if result.action == PaginationAction.PREVIOUS_PAGE:
-            return self._show_paginated_videos(state_machine, result.data, items_per_page, on_video_select)
-        elif result.action == PaginationAction.NEXT_PAGE:
-            return self._show_paginated_videos(state_machine, result.data, items_per_page, on_video_select)
-        elif result.action == PaginationAction.GO_BACK:
-            return "work_with_videos"
-        elif result.action == PaginationAction.ITEM_SELECTED:
-            # Return the state from the custom callback
-            return result.data
-        else:
-            # Use the page from result.data if available, otherwise default to 0
-            current_page = result.data if result.data is not None else 0
-            return self._show_paginated_videos(state_machine, current_page, items_per_page, on_video_select)
+            if result.action in (PaginationAction.PREVIOUS_PAGE, PaginationAction.NEXT_PAGE):
+                page = result.data
+            elif result.action == PaginationAction.GO_BACK:
+                return "work_with_videos"
+            elif result.action == PaginationAction.ITEM_SELECTED:
+                # Return the state from the custom callback
+                return result.data
+            else:
+                # Use the page from result.data if available, otherwise default to 0
+                page = result.data if result.data is not None else 0
     
     def _show_video_details(self, video):
         """Show detailed information for a specific video"""
-        print("\n" + "=" * 60)
-        print("VIDEO DETAILS")
-        print("=" * 60)
-        print(video.display_verbose())
-        print("=" * 60)
+        sys.stdout.write(f"\n{_SEP60}VIDEO DETAILS\n{_SEP60}{video.display_verbose()}\n{_SEP60}")
+        sys.stdout.flush()
     
     def _show_paginated_replicas_for_selection(self, state_machine, page=0, filter_type="all"):
         """Show paginated list of replicas for selection and return the selected replica ID"""
-        # Update replicas if needed
-        if not self.replicas:
-            with yaspin(text="Loading replicas..."):
+        # Update replicas if missing or stale
+        self._wait_for_replicas()
+        if self._replicas_stale(state_machine):
+            with spinner("Loading replicas..."):
                 self._update_replicas_for_selection(state_machine)
+        self._report_fetch_error()
         
         if not self.replicas:
             print("No replicas found. Please create a replica first.")
             input("Press Enter to continue...")
             return None
 
-        # Use the generic paginated replica list
-        paginated_list = PaginatedReplicaList(self.replicas, 10)
+        # Reuse the paginated replica list so its type partition is computed once per fetch
+        paginated_list = self._replica_selection_list
+        if paginated_list is None or paginated_list.replicas is not self.replicas:
+            paginated_list = PaginatedReplicaList(self.replicas, 10)
+            self._replica_selection_list = paginated_list
         result = paginated_list.show(
             state_machine=state_machine,
             page=page,
@@ -362,14 +445,31 @@ class VideoModule(ModuleInterface):
         
         return result
     
+    def _replicas_stale(self, state_machine) -> bool:
+        """Check whether replicas need to be fetched again"""
+        return (not self.replicas or self._replicas_api_key != state_machine.api_key
+                or time.monotonic() - self._replicas_cache_ts >= self.REPLICAS_TTL)
+    
+    def _wait_for_replicas(self) -> None:
+        """Block until a background replicas fetch, if any, has finished"""
+        if self._replicas_future is not None:
+            with spinner("Loading replicas..."):
+                self._replicas_future.result()
+            self._replicas_future = None
+    
     def _update_replicas_for_selection(self, state_machine) -> None:
         """Update the replicas list from API for selection"""
-        if state_machine.api_client is None:
+        api_client = state_machine.api_client
+        api_key = state_machine.api_key
+        if api_client is None:
             print("Error: API client not initialized. Please set your API key first.")
             return
 
-        success, message, fetched_replicas = state_machine.api_client.list_replicas()
+        success, message, fetched_replicas = api_client.list_replicas()
         if success:
             self.replicas = fetched_replicas
+            self._replicas_cache_ts = time.monotonic()
+            self._replicas_api_key = api_key
+            self._replica_selection_list = None
         else:
-            print(message) 
\ No newline at end of file
+            self._fetch_error = message 
\ No newline at end of file
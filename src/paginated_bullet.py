@@ -1,25 +1,52 @@
 #!/usr/bin/env python3
 
 from typing import List
+import os
+import shutil
 import sys
 import tty
 import termios
 
+# Raw input bytes mapped to the logical keys handled by PaginatedBullet.launch
+_KEYMAP = {
+    b'\x1b[A': 'up',
+    b'\x1b[B': 'down',
+    b'\x1b[C': 'right',
+    b'\x1b[D': 'left',
+    b'k': 'up',
+    b'j': 'down',
+    b'h': 'left',
+    b'l': 'right',
+    b'\r': 'enter',
+    b'\n': 'enter',
+    b'q': 'q',
+}
+
+def press_any_key(prompt: str = "Press any key to continue...") -> None:
+    """Wait for a single keypress instead of reading a whole line with input()"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        # cbreak keeps CTRL-C working while returning each key as soon as it is typed
+        tty.setcbreak(fd)
+        os.read(fd, 8)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    sys.stdout.write("\n")
+
 class PaginatedBullet:
     """Custom Bullet implementation with left/right arrow key navigation for pagination, with in-place redraw like Bullet."""
     
     def __init__(self, prompt: str, choices: List[str], bullet: str = "→", margin: int = 2, shift: int = 0,
                  bullet_color: str = '\x1b[39m', word_color: str = '\x1b[39m', 
                  word_on_switch: str = '\x1b[7m', background_color: str = '\x1b[49m', 
-                 background_on_switch: str = '\x1b[7m'):
-        self.prompt = prompt
-        self.choices = choices
+                 background_on_switch: str = '\x1b[7m', has_previous_page: bool = None,
+                 has_next_page: bool = None):
         self.bullet = bullet
         self.margin = margin
         self.shift = shift
-        self.current_index = 0
-        self.has_previous_page = any("Previous Page" in choice for choice in choices)
-        self.has_next_page = any("Next Page" in choice for choice in choices)
         
         # Color codes for highlighting
         self.bullet_color = bullet_color
@@ -28,104 +55,152 @@ class PaginatedBullet:
         self.background_color = background_color
         self.background_on_switch = background_on_switch
         self.reset_color = '\x1b[0m'
+        # Bytes read from the terminal but not yet handled, e.g. while a key is held down
+        self._pending = b''
+        
+        self.set_choices(prompt, choices, has_previous_page, has_next_page)
+    
+    def set_choices(self, prompt: str, choices: List[str], has_previous_page: bool = None,
+                    has_next_page: bool = None):
+        """Replace the prompt and choices so the same menu can be launched for another page"""
+        self.prompt = prompt
+        self.choices = choices
+        self.current_index = 0
+        # Callers that know the page state pass it in; otherwise look for the nav entries
+        if has_previous_page is None:
+            has_previous_page = "← Previous Page" in choices
+        if has_next_page is None:
+            has_next_page = "→ Next Page" in choices
+        self.has_previous_page = has_previous_page
+        self.has_next_page = has_next_page
         self._lines_printed = 0
         self._first_draw = True
+        self._terminal_size = None
+        
+        # Pre-render every choice in both states so redraws only pick cached strings
+        indent = ' ' * (self.margin + len(self.bullet) + 1)
+        self._unselected_lines = [f"{indent}{self.word_color}{choice}{self.reset_color}\n" for choice in choices]
+        self._selected_lines = [f"{' ' * self.margin}{self.bullet_color}{self.bullet}{self.reset_color} {self.word_on_switch}{choice}{self.reset_color}\n"
+                                for choice in choices]
+        # Row of the first choice within the frame (prompt lines + blank line)
+        self._choices_top = prompt.count("\n") + 2
     
     def launch(self) -> str:
         """Launch the interactive menu with arrow key navigation"""
-        while True:
-            self._display()
-            key = self._get_key()
+        # Switch the terminal to raw input once for the whole menu rather than per keypress
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            # Keep output post-processing so '\n' still returns the carriage while drawing
+            raw_settings = termios.tcgetattr(fd)
+            raw_settings[1] = old_settings[1]
+            termios.tcsetattr(fd, termios.TCSANOW, raw_settings)
             
-            if key == 'up' or key == 'k':
-                self.current_index = (self.current_index - 1) % len(self.choices)
-            elif key == 'down' or key == 'j':
-                self.current_index = (self.current_index + 1) % len(self.choices)
-            elif key == 'left' and self.has_previous_page:
-                return "← Previous Page"
-            elif key == 'right' and self.has_next_page:
-                return "→ Next Page"
-            elif key == 'enter':
-                return self.choices[self.current_index]
-            elif key == 'q':
-                return "← Go Back"
-    
-    def _move_cursor_up(self, n):
-        """Move cursor up by n lines"""
-        if n > 0:
-            sys.stdout.write(f"\x1b[{n}A")
-            sys.stdout.flush()
+            self._display()
+            while True:
+                key = self._get_key(fd)
+                
+                if key == 'up' or key == 'k':
+                    self._move_selection((self.current_index - 1) % len(self.choices))
+                elif key == 'down' or key == 'j':
+                    self._move_selection((self.current_index + 1) % len(self.choices))
+                elif key == 'left' and self.has_previous_page:
+                    return "← Previous Page"
+                elif key == 'right' and self.has_next_page:
+                    return "→ Next Page"
+                elif key == 'enter':
+                    return self.choices[self.current_index]
+                elif key == 'q':
+                    return "← Go Back"
+        finally:
+            # Also runs on CTRL-C (SystemExit) and KeyboardInterrupt
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
     def _display(self):
         """Display the current menu state with in-place redraw like Bullet"""
-        menu_lines = 2 + len(self.choices) + 2  # prompt + blank + choices + blank + nav
+        # Build the whole frame, including the cursor-up escape, and emit it in one write
+        buf = []
         
         if not self._first_draw:
-            self._move_cursor_up(self._lines_printed)
+            if self._lines_printed > 0:
+                buf.append(f"\x1b[{self._lines_printed}A")
         else:
             self._first_draw = False
         
-        self._lines_printed = 0
+        buf.append(self.prompt)
+        buf.append("\n\n")
         
-        print(self.prompt)
-        self._lines_printed += 1
-        print()
-        self._lines_printed += 1
+        choices_start = len(buf)
+        buf.extend(self._unselected_lines)
+        buf[choices_start + self.current_index] = self._selected_lines[self.current_index]
         
-        for i, choice in enumerate(self.choices):
-            if i == self.current_index:
-                print(f"{' ' * self.margin}{self.bullet_color}{self.bullet}{self.reset_color} {self.word_on_switch}{choice}{self.reset_color}")
-            else:
-                print(f"{' ' * (self.margin + len(self.bullet) + 1)}{self.word_color}{choice}{self.reset_color}")
-            self._lines_printed += 1
+        buf.append("\nNavigation: ↑/↓ to select, ←/→ for pages, Enter to confirm, Q to go back\n")
         
-        print()
-        self._lines_printed += 1
-        print("Navigation: ↑/↓ to select, ←/→ for pages, Enter to confirm, Q to go back")
-        self._lines_printed += 1
+        frame = "".join(buf)
+        self._lines_printed = frame.count("\n")
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        self._terminal_size = shutil.get_terminal_size()
     
-    def _get_key(self) -> str:
-        """Get a single keypress from the user"""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-            
-            # Handle CTRL-C (ASCII 3)
-            if ch == '\x03':
-                # Restore terminal settings before exiting
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                sys.exit(0)
-            
-            # Handle arrow keys and other special keys
-            if ch == '\x1b':
-                next_ch = sys.stdin.read(1)
-                if next_ch == '[':
-                    third_ch = sys.stdin.read(1)
-                    if third_ch == 'A':
-                        return 'up'
-                    elif third_ch == 'B':
-                        return 'down'
-                    elif third_ch == 'C':
-                        return 'right'
-                    elif third_ch == 'D':
-                        return 'left'
-            
-            # Handle other keys
-            if ch == 'k':
-                return 'up'
-            elif ch == 'j':
-                return 'down'
-            elif ch == 'h':
-                return 'left'
-            elif ch == 'l':
-                return 'right'
-            elif ch == '\r' or ch == '\n':
-                return 'enter'
-            elif ch == 'q':
-                return 'q'
-            
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings) 
\ No newline at end of file
+    def _move_selection(self, new_index: int):
+        """Move the highlight, repainting only the two affected choice lines"""
+        old_index = self.current_index
+        self.current_index = new_index
+        if old_index == new_index:
+            return
+        
+        # A resize may have re-wrapped the frame, so fall back to a full redraw
+        if shutil.get_terminal_size() != self._terminal_size:
+            self._display()
+            return
+        
+        # The cursor rests on the line just below the frame
+        buf = []
+        row = self._lines_printed
+        for index, line in ((old_index, self._unselected_lines[old_index]),
+                            (new_index, self._selected_lines[new_index])):
+            target = self._choices_top + index
+            buf.append(self._cursor_move(target - row))
+            buf.append("\r")
+            buf.append(line)
+            row = target + 1
+        buf.append(self._cursor_move(self._lines_printed - row))
+        
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+    
+    @staticmethod
+    def _cursor_move(rows: int) -> str:
+        """Return the escape sequence moving the cursor down (positive) or up (negative) by rows"""
+        if rows > 0:
+            return f"\x1b[{rows}B"
+        if rows < 0:
+            return f"\x1b[{-rows}A"
+        return ""
+    
+    def _get_key(self, fd: int) -> str:
+        """Get a single keypress from the user; the terminal must already be in raw mode"""
+        # One read may return several keys (key repeat, fast typing); they are handed
+        # out one per call, and a read returns a whole escape sequence such as an arrow key
+        if not self._pending:
+            self._pending = os.read(fd, 64)
+        buf = self._pending
+        ch = buf[:1]
+        
+        # Handle CTRL-C (ASCII 3); launch() restores the terminal on the way out
+        if ch == b'\x03':
+            self._pending = b''
+            sys.exit(0)
+        
+        # Consume a whole escape sequence (CSI up to its final byte, or SS3), else one byte
+        length = 1
+        if ch == b'\x1b' and buf[1:2] == b'[':
+            length = 2
+            while length < len(buf) and not 0x40 <= buf[length] <= 0x7e:
+                length += 1
+            length = min(length + 1, len(buf))
+        elif ch == b'\x1b' and buf[1:2] == b'O':
+            length = min(3, len(buf))
+        key, self._pending = buf[:length], buf[length:]
+        return _KEYMAP.get(key, ch.decode('latin-1'))
@@ -1,9 +1,24 @@
 #!/usr/bin/env python3
 
-from typing import List, Callable, Optional, Any
-from bullet import Bullet
+import sys
+from collections import namedtuple
+from typing import List, Callable, Optional, Any, Dict
 from enum import Enum
-from paginated_bullet import PaginatedBullet
+from paginated_bullet import PaginatedBullet, press_any_key
+
+# Separator lines, each written together with the text around it in one call
+_SEP50 = "=" * 50 + "\n"
+_SEP60 = "=" * 60 + "\n"
+
+# Navigation entries every page menu can return, mapped to (kind, payload) like the item entries
+_NAV_CHOICES = {
+    "← Previous Page": ("previous", None),
+    "→ Next Page": ("next", None),
+    "← Go Back": ("back", None),
+}
+
+# Labels derived from a list's title and filter type, see PaginatedList._labels
+_ListLabels = namedtuple("_ListLabels", ["title_lower", "prompt", "empty_prompt", "filter_label"])
 
 class PaginationAction(Enum):
     """Actions that can be returned from paginated list interactions"""
@@ -23,10 +38,17 @@ class PaginatedListResult:
 class PaginatedList:
     """Generic paginated list display component"""
     
+    # display_short function per item class (None when the class has none), shared by all lists
+    _display_short_cache: Dict[type, Optional[Callable[[Any], str]]] = {}
+    
     def __init__(self, items: List[Any], items_per_page: int = 10):
         self.items = items
         self.items_per_page = items_per_page
         self.current_page = 0
+        self.selected_index = None  # Index into items of the last selected item
+        self._choices_cache = {}  # (choices, choice_map) per page and display options, see _choices_key
+        self._labels_cache = {}  # _ListLabels per (title, filter_type)
+        self._cli = None  # Page menu, created on first show and reused for later pages
     
     def show(self, 
              title: str = "Items",
@@ -34,7 +56,8 @@ class PaginatedList:
              on_item_select: Optional[Callable[[Any], PaginatedListResult]] = None,
              on_filter_change: Optional[Callable[[str], PaginatedListResult]] = None,
              show_filter_option: bool = True,
-             custom_choices: Optional[List[str]] = None) -> PaginatedListResult:
+             custom_choices: Optional[List[str]] = None,
+             _items: Optional[List[Any]] = None) -> PaginatedListResult:
         """
         Show a paginated list of items
         
@@ -45,138 +68,181 @@ class PaginatedList:
             on_filter_change: Callback function when filter is changed
             show_filter_option: Whether to show filter selection option
             custom_choices: Custom choices to add to the menu
+            _items: Items to page through instead of self.items, for subclasses
             
         Returns:
             PaginatedListResult: Result indicating the action taken
         """
-        if not self.items:
+        items = self.items if _items is None else _items
+        if not items:
             return self._show_empty_list(title, filter_type, on_filter_change)
         
-        total_pages = (len(self.items) - 1) // self.items_per_page
-        start_idx = self.current_page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.items))
-        current_items = self.items[start_idx:end_idx]
-        
-        print(f"\nPage {self.current_page + 1} of {total_pages + 1} ({len(self.items)} {filter_type} {title.lower()})")
-        print("=" * 50)
-        
-        # Build choices list
-        choices = []
-        
-        # Add filter option if enabled
-        if show_filter_option:
-            choices.append(f"Current filter: {filter_type}")
-        
-        # Add custom choices if provided
-        if custom_choices:
-            choices.extend(custom_choices)
-        
-        # Add navigation options
-        if self.current_page > 0:
-            choices.append("← Previous Page")
-        
-        # Add item choices
-        for i, item in enumerate(current_items, start_idx + 1):
-            if hasattr(item, 'display_short'):
-                choices.append(f"{i}. {item.display_short()}")
-            else:
-                choices.append(f"{i}. {str(item)}")
-        
-        # Add navigation options
-        if self.current_page < total_pages:
-            choices.append("→ Next Page")
-        
-        choices.append("← Go Back")
+        # Hoist the length and paging attributes used throughout into locals
+        item_count = len(items)
+        items_per_page = self.items_per_page
+        current_page = self.current_page
+        total_pages = (item_count - 1) // items_per_page
+        start_idx = current_page * items_per_page
+        end_idx = min(start_idx + items_per_page, item_count)
+        
+        labels = self._labels(title, filter_type)
+        sys.stdout.write(f"\nPage {current_page + 1} of {total_pages + 1} ({item_count} {filter_type} {labels.title_lower})\n{_SEP50}")
+        sys.stdout.flush()
+        
+        # Reuse the choices built the last time this page was shown
+        cache_key = self._choices_key(items, filter_type, show_filter_option, custom_choices)
+        cached = self._choices_cache.get(cache_key)
+        if cached is not None:
+            choices, choice_map = cached
+        else:
+            # Build choices list, mapping each selectable entry to what it stands for
+            choices = []
+            choice_map = dict(_NAV_CHOICES)
+            
+            # Add filter option if enabled
+            if show_filter_option:
+                choices.append(labels.filter_label)
+                choice_map[labels.filter_label] = ("filter", filter_type)
+            
+            # Add custom choices if provided
+            if custom_choices:
+                choices.extend(custom_choices)
+            
+            # Add navigation options
+            if current_page > 0:
+                choices.append("← Previous Page")
+            
+            # Add item choices; the page is only sliced out when its choices are built
+            current_items = items[start_idx:end_idx]
+            self._add_item_choices(current_items, start_idx, choices, choice_map)
+            
+            # Add navigation options
+            if current_page < total_pages:
+                choices.append("→ Next Page")
+            
+            choices.append("← Go Back")
+            # A short page (e.g. a lazily fetched page that failed to load) is rebuilt next time
+            if len(current_items) == end_idx - start_idx:
+                self._choices_cache[cache_key] = (choices, choice_map)
         
         # Show menu
-        cli = PaginatedBullet(
-            prompt=f"Select a {title.lower()} to view details or navigate:",
-            choices=choices,
-            bullet="→",
-            margin=2,
-            shift=0,
-        )
-        
-        result = cli.launch()
+        result = self._launch_menu(labels.prompt, choices, current_page > 0, current_page < total_pages)
+        return self._handle_choice(items, choice_map.get(result), on_item_select, on_filter_change)
+    
+    def _add_item_choices(self, current_items: List[Any], start_idx: int,
+                          choices: List[str], choice_map: Dict[str, tuple]):
+        """Append the choices for the items of the current page; subclasses may add extra rows"""
+        item_choices = [f"{i}. {self._short_label(item)}"
+                        for i, item in enumerate(current_items, start_idx + 1)]
+        choices.extend(item_choices)
+        # Feed the map from a generator rather than building a second throwaway list
+        choice_map.update(zip(item_choices, (("item", i) for i in range(start_idx, start_idx + len(item_choices)))))
+    
+    def _launch_menu(self, prompt: str, choices: List[str], has_previous_page: bool,
+                     has_next_page: bool) -> str:
+        """Launch the page menu, reusing the PaginatedBullet from earlier pages"""
+        if self._cli is None:
+            self._cli = PaginatedBullet(
+                prompt=prompt,
+                choices=choices,
+                bullet="→",
+                margin=2,
+                shift=0,
+                has_previous_page=has_previous_page,
+                has_next_page=has_next_page,
+            )
+        else:
+            self._cli.set_choices(prompt, choices, has_previous_page, has_next_page)
+        return self._cli.launch()
+    
+    def _short_label(self, item: Any) -> str:
+        """Return the one-line label of an item, looking up display_short once per class"""
+        item_type = type(item)
+        try:
+            display_short = self._display_short_cache[item_type]
+        except KeyError:
+            display_short = getattr(item_type, 'display_short', None)
+            self._display_short_cache[item_type] = display_short
+        return display_short(item) if display_short else str(item)
+    
+    def _handle_choice(self, items: List[Any], choice: Optional[tuple],
+                       on_item_select: Optional[Callable[[Any], PaginatedListResult]],
+                       on_filter_change: Optional[Callable[[str], PaginatedListResult]]) -> PaginatedListResult:
+        """Act on a (kind, payload) entry from the choice map of the page just shown"""
+        # Headers, custom choices and unknown results have no entry
+        kind, payload = choice or (None, None)
         
         # Handle filter selection
-        if show_filter_option and result == f"Current filter: {filter_type}":
+        if kind == "filter":
             if on_filter_change:
-                return on_filter_change(filter_type)
-            return PaginatedListResult(PaginationAction.FILTER_CHANGED, filter_type)
+                return on_filter_change(payload)
+            return PaginatedListResult(PaginationAction.FILTER_CHANGED, payload)
         
         # Handle navigation
-        if result == "← Previous Page":
+        if kind == "previous":
             self.current_page -= 1
             return PaginatedListResult(PaginationAction.PREVIOUS_PAGE, self.current_page)
-        elif result == "→ Next Page":
+        elif kind == "next":
             self.current_page += 1
             return PaginatedListResult(PaginationAction.NEXT_PAGE, self.current_page)
-        elif result == "← Go Back":
+        elif kind == "back":
             return PaginatedListResult(PaginationAction.GO_BACK)
         
         # Handle item selection
-        if result.startswith("→") or result.startswith("---"):
-            return PaginatedListResult(PaginationAction.NO_ACTION)
-        
-        # Extract item index from selection
-        try:
-            item_idx = int(result.split('.')[0]) - 1
-            if 0 <= item_idx < len(self.items):
-                selected_item = self.items[item_idx]
-                
-                if on_item_select:
-                    return on_item_select(selected_item)
-                else:
-                    # Default behavior: show item details
-                    self._show_item_details(selected_item)
-                    input("Press Enter to continue...")
-                    return PaginatedListResult(PaginationAction.NO_ACTION)
-        except (ValueError, IndexError):
-            pass
+        if kind == "item":
+            selected_item = items[payload]
+            self.selected_index = payload
+            
+            if on_item_select:
+                return on_item_select(selected_item)
+            # Default behavior: show item details
+            self._show_item_details(selected_item)
+            press_any_key()
         
         return PaginatedListResult(PaginationAction.NO_ACTION)
     
     def _show_empty_list(self, title: str, filter_type: str, 
                         on_filter_change: Optional[Callable[[str], PaginatedListResult]]) -> PaginatedListResult:
         """Show empty list with options"""
-        print(f"\nNo {filter_type} {title.lower()} found.")
-        print("=" * 50)
-        
-        choices = []
-        choices.append(f"Current filter: {filter_type}")
-        choices.append("← Go Back")
+        labels = self._labels(title, filter_type)
+        sys.stdout.write(f"\nNo {filter_type} {labels.title_lower} found.\n{_SEP50}")
+        sys.stdout.flush()
         
-        cli = PaginatedBullet(
-            prompt=f"No {title.lower()} found. What would you like to do?",
-            choices=choices,
-            bullet="→",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
+        choices = [labels.filter_label, "← Go Back"]
+        choice_map = {labels.filter_label: ("filter", filter_type), "← Go Back": _NAV_CHOICES["← Go Back"]}
         
-        if result == f"Current filter: {filter_type}":
-            if on_filter_change:
-                return on_filter_change(filter_type)
-            return PaginatedListResult(PaginationAction.FILTER_CHANGED, filter_type)
-        elif result == "← Go Back":
-            return PaginatedListResult(PaginationAction.GO_BACK)
-        
-        return PaginatedListResult(PaginationAction.NO_ACTION)
+        result = self._launch_menu(labels.empty_prompt, choices, False, False)
+        return self._handle_choice([], choice_map.get(result), None, on_filter_change)
     
     def _show_item_details(self, item: Any):
         """Show detailed information for a specific item"""
-        print("\n" + "=" * 60)
-        print(f"{type(item).__name__.upper()} DETAILS")
-        print("=" * 60)
-        
-        if hasattr(item, 'display_verbose'):
-            print(item.display_verbose())
-        else:
-            print(str(item))
-        
-        print("=" * 60)
+        details = item.display_verbose() if hasattr(item, 'display_verbose') else str(item)
+        sys.stdout.write(f"\n{_SEP60}{type(item).__name__.upper()} DETAILS\n{_SEP60}{details}\n{_SEP60}")
+        sys.stdout.flush()
+    
+    def _labels(self, title: str, filter_type: str) -> _ListLabels:
+        """Return the display labels for a title and filter type, formatting them once"""
+        labels = self._labels_cache.get((title, filter_type))
+        if labels is None:
+            title_lower = title.lower()
+            labels = _ListLabels(
+                title_lower=title_lower,
+                prompt=f"Select a {title_lower} to view details or navigate:",
+                empty_prompt=f"No {title_lower} found. What would you like to do?",
+                filter_label=f"Current filter: {filter_type}",
+            )
+            self._labels_cache[(title, filter_type)] = labels
+        return labels
+    
+    def _choices_key(self, items: List[Any], filter_type: str, show_filter_option: bool,
+                     custom_choices: Optional[List[str]]) -> tuple:
+        """Key identifying the menu choices of the current page of items"""
+        return (id(items), len(items), self.items_per_page, self.current_page,
+                filter_type, show_filter_option, tuple(custom_choices or ()))
+    
+    def clear_choices_cache(self):
+        """Drop cached menu choices; call after changing how any item is displayed"""
+        self._choices_cache.clear()
     
     def set_page(self, page: int):
         """Set the current page"""
@@ -205,15 +271,17 @@ class FilteredPaginatedList(PaginatedList):
     
     def set_filter(self, filter_func: Callable[[Any], bool], filter_name: str = "filtered"):
         """Set a filter function to filter items"""
-        self.filtered_items = [item for item in self.items if filter_func(item)]
+        self.filtered_items = list(filter(filter_func, self.items))
         self.current_filter = filter_name
         self.current_page = 0  # Reset to first page when filter changes
+        self.clear_choices_cache()
     
     def clear_filter(self):
         """Clear the current filter"""
         self.filtered_items = self.items
         self.current_filter = "all"
         self.current_page = 0
+        self.clear_choices_cache()
     
     def show(self, 
              title: str = "Items",
@@ -223,17 +291,8 @@ class FilteredPaginatedList(PaginatedList):
              show_filter_option: bool = True,
              custom_choices: Optional[List[str]] = None) -> PaginatedListResult:
         """Show filtered paginated list"""
-        # Temporarily replace items with filtered items
-        original_items = self.items
-        self.items = self.filtered_items
-        
-        try:
-            result = super().show(title, filter_type, on_item_select, on_filter_change, 
-                                show_filter_option, custom_choices)
-            return result
-        finally:
-            # Restore original items
-            self.items = original_items
+        return super().show(title, filter_type, on_item_select, on_filter_change,
+                            show_filter_option, custom_choices, _items=self.filtered_items)
     
     def get_filtered_items_count(self) -> int:
         """Get the count of filtered items"""
@@ -251,168 +310,57 @@ class SectionedPaginatedList(PaginatedList):
         super().__init__(items, items_per_page)
         self.sections = []
         self.section_names = []
+        self._item_section_ids = []  # Section index of each item, by global index
+        self._section_starts = set()  # Global indices where a section begins
+        self._section_headers = []
     
     def set_sections(self, sections: List[List[Any]], section_names: List[str]):
         """Set sections for the list"""
         self.sections = sections
         self.section_names = section_names
+        self._section_headers = [f"--- {name} ---" for name in section_names]
         # Flatten sections into items for pagination
         self.items = []
-        for section in sections:
+        self._item_section_ids = []
+        self._section_starts = set()
+        for section_idx, section in enumerate(sections):
+            self._section_starts.add(len(self.items))
             self.items.extend(section)
+            self._item_section_ids.extend([section_idx] * len(section))
+        self.clear_choices_cache()
     
-    def show(self, 
-             title: str = "Items",
-             filter_type: str = "all",
-             on_item_select: Optional[Callable[[Any], PaginatedListResult]] = None,
-             on_filter_change: Optional[Callable[[str], PaginatedListResult]] = None,
-             show_filter_option: bool = True,
-             custom_choices: Optional[List[str]] = None) -> PaginatedListResult:
-        """Show sectioned paginated list"""
-        if not self.items:
-            return self._show_empty_list(title, filter_type, on_filter_change)
-        
-        total_pages = (len(self.items) - 1) // self.items_per_page
-        start_idx = self.current_page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.items))
-        current_items = self.items[start_idx:end_idx]
-        
-        print(f"\nPage {self.current_page + 1} of {total_pages + 1} ({len(self.items)} {filter_type} {title.lower()})")
-        print("=" * 50)
-        
-        # Build choices list
-        choices = []
-        
-        # Add filter option if enabled
-        if show_filter_option:
-            choices.append(f"Current filter: {filter_type}")
-        
-        # Add custom choices if provided
-        if custom_choices:
-            choices.extend(custom_choices)
-        
-        # Add navigation options
-        if self.current_page > 0:
-            choices.append("← Previous Page")
-        
-        # Add sectioned items with headers
-        if len(self.sections) > 1:
-            # Multi-section view
-            for i, item in enumerate(current_items):
-                global_idx = start_idx + i + 1
-                
-                # Find which section this item belongs to
-                section_idx = self._find_item_section(item, start_idx + i)
-                if section_idx >= 0 and section_idx < len(self.section_names):
-                    # Check if this is the first item in this section on this page
-                    if self._is_first_item_in_section_on_page(item, start_idx + i, start_idx):
-                        choices.append(f"--- {self.section_names[section_idx]} ---")
-                
-                if hasattr(item, 'display_short'):
-                    choices.append(f"{global_idx}. {item.display_short()}")
-                else:
-                    choices.append(f"{global_idx}. {str(item)}")
-        else:
+    def _add_item_choices(self, current_items: List[Any], start_idx: int,
+                          choices: List[str], choice_map: Dict[str, tuple]):
+        """Append the choices for the items of the current page, with section headers"""
+        if len(self.sections) <= 1:
             # Single section view
-            for i, item in enumerate(current_items, start_idx + 1):
-                if hasattr(item, 'display_short'):
-                    choices.append(f"{i}. {item.display_short()}")
-                else:
-                    choices.append(f"{i}. {str(item)}")
-        
-        # Add navigation options
-        if self.current_page < total_pages:
-            choices.append("→ Next Page")
+            super()._add_item_choices(current_items, start_idx, choices, choice_map)
+            return
         
-        choices.append("← Go Back")
-        
-        # Show menu
-        cli = PaginatedBullet(
-            prompt=f"Select a {title.lower()} to view details or navigate:",
-            choices=choices,
-            bullet="→",
-            margin=2,
-            shift=0,
-        )
-        
-        result = cli.launch()
-        
-        # Handle filter selection
-        if show_filter_option and result == f"Current filter: {filter_type}":
-            if on_filter_change:
-                return on_filter_change(filter_type)
-            return PaginatedListResult(PaginationAction.FILTER_CHANGED, filter_type)
-        
-        # Handle navigation
-        if result == "← Previous Page":
-            self.current_page -= 1
-            return PaginatedListResult(PaginationAction.PREVIOUS_PAGE, self.current_page)
-        elif result == "→ Next Page":
-            self.current_page += 1
-            return PaginatedListResult(PaginationAction.NEXT_PAGE, self.current_page)
-        elif result == "← Go Back":
-            return PaginatedListResult(PaginationAction.GO_BACK)
-        
-        # Handle item selection
-        if result.startswith("→") or result.startswith("---"):
-            return PaginatedListResult(PaginationAction.NO_ACTION)
-        
-        # Extract item index from selection
-        try:
-            item_idx = int(result.split('.')[0]) - 1
-            if 0 <= item_idx < len(self.items):
-                selected_item = self.items[item_idx]
-                
-                if on_item_select:
-                    return on_item_select(selected_item)
-                else:
-                    # Default behavior: show item details
-                    self._show_item_details(selected_item)
-                    input("Press Enter to continue...")
-                    return PaginatedListResult(PaginationAction.NO_ACTION)
-        except (ValueError, IndexError):
-            pass
-        
-        return PaginatedListResult(PaginationAction.NO_ACTION)
+        # Multi-section view
+        for i, item in enumerate(current_items):
+            global_idx = start_idx + i + 1
+            
+            # Find which section this item belongs to
+            section_idx = self._find_item_section(item, start_idx + i)
+            if section_idx >= 0 and section_idx < len(self.section_names):
+                # Check if this is the first item in this section on this page
+                if self._is_first_item_in_section_on_page(item, start_idx + i, start_idx):
+                    choices.append(self._section_headers[section_idx])
+            
+            item_choice = f"{global_idx}. {self._short_label(item)}"
+            choices.append(item_choice)
+            choice_map[item_choice] = ("item", start_idx + i)
     
     def _find_item_section(self, item: Any, global_idx: int) -> int:
         """Find which section an item belongs to based on its global index"""
-        if not self.sections:
-            return -1
-        
-        # Calculate which section this item belongs to based on the flattened sections
-        current_idx = 0
-        for section_idx, section in enumerate(self.sections):
-            if current_idx <= global_idx < current_idx + len(section):
-                return section_idx
-            current_idx += len(section)
-        
+        if 0 <= global_idx < len(self._item_section_ids):
+            return self._item_section_ids[global_idx]
         return -1
     
     def _is_first_item_in_section_on_page(self, item: Any, global_idx: int, page_start_idx: int) -> bool:
         """Check if this is the first item of its section on the current page"""
-        if not self.sections:
+        if self._find_item_section(item, global_idx) < 0:
             return False
         
-        # Find which section this item belongs to
-        section_idx = self._find_item_section(item, global_idx)
-        if section_idx < 0:
-            return False
-        
-        # Check if this is the first item of this section on this page
-        current_idx = 0
-        for i, section in enumerate(self.sections):
-            if i == section_idx:
-                # This is the section we're looking for
-                section_start_idx = current_idx
-                section_end_idx = current_idx + len(section)
-                
-                # Check if this item is the first item of this section on this page
-                if (section_start_idx <= global_idx < section_end_idx and 
-                    (global_idx == page_start_idx or 
-                     self._find_item_section(self.items[global_idx - 1], global_idx - 1) != section_idx)):
-                    return True
-                break
-            current_idx += len(section)
-        
-        return False 
\ No newline at end of file
+        return global_idx == page_start_idx or global_idx in self._section_starts
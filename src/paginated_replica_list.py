@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
-from typing import List, Callable, Optional, Any, Union
-from paginated_list import PaginatedList, SectionedPaginatedList, PaginatedListResult, PaginationAction
+import sys
+from typing import List, Callable, Optional, Any
+from paginated_list import PaginatedList, SectionedPaginatedList, PaginatedListResult, PaginationAction, _SEP60
 from bullet import Bullet
+from paginated_bullet import press_any_key
 
 class PaginatedReplicaList:
     """Generic paginated replica list that can be used by all modules"""
@@ -10,6 +12,17 @@ class PaginatedReplicaList:
     def __init__(self, replicas: List[Any], items_per_page: int = 10):
         self.replicas = replicas
         self.items_per_page = items_per_page
+        self._sectioned_lists = {}
+        self._filter_cli = None  # Filter menu, created on first use and relaunched afterwards
+        
+        # Group replicas by type once; remove_replica keeps the groups current
+        self._by_type = by_type = {}
+        for replica in replicas:
+            # Look the group up instead of setdefault(), which allocates a spare list per replica
+            group = by_type.get(replica.replica_type)
+            if group is None:
+                group = by_type[replica.replica_type] = []
+            group.append(replica)
     
     def show(self, 
              state_machine,
@@ -39,38 +52,6 @@ class PaginatedReplicaList:
             input("Press Enter to continue...")
             return None
 
-        # Filter replicas based on type
-        if filter_type == "user":
-            filtered_replicas = [r for r in self.replicas if r.replica_type == "user"]
-            sectioned_replicas = [filtered_replicas]
-            section_names = ["User Replicas"]
-        elif filter_type == "system":
-            filtered_replicas = [r for r in self.replicas if r.replica_type == "system"]
-            sectioned_replicas = [filtered_replicas]
-            section_names = ["System Replicas"]
-        else:  # "all"
-            user_replicas = [r for r in self.replicas if r.replica_type == "user"]
-            system_replicas = [r for r in self.replicas if r.replica_type == "system"]
-            filtered_replicas = user_replicas + system_replicas
-            sectioned_replicas = [user_replicas, system_replicas]
-            section_names = ["User Replicas", "System Replicas"]
-
-        if not filtered_replicas:
-            # Create empty paginated list for proper empty state handling
-            paginated_list = PaginatedList([])
-            result = paginated_list.show(
-                title=title,
-                filter_type=filter_type,
-                on_filter_change=self._handle_filter_change,
-                show_filter_option=show_filter_option
-            )
-            return self._handle_pagination_result(result, state_machine, page, filter_type, on_replica_select, show_filter_option, title, return_replica_id)
-
-        # Create sectioned paginated list
-        paginated_list = SectionedPaginatedList(filtered_replicas, self.items_per_page)
-        paginated_list.set_sections(sectioned_replicas, section_names)
-        paginated_list.set_page(page)
-
         def on_replica_select_wrapper(replica):
             if return_replica_id:
                 # Return the replica ID for selection
@@ -85,69 +66,102 @@ class PaginatedReplicaList:
             else:
                 # Default behavior: show replica details
                 self._show_replica_details(replica)
-                input("Press Enter to continue...")
+                press_any_key()
                 # Return the current page so we stay on the same page
                 return PaginatedListResult(PaginationAction.NO_ACTION, paginated_list.get_current_page())
 
-        result = paginated_list.show(
-            title=title,
-            filter_type=filter_type,
-            on_item_select=on_replica_select_wrapper,
-            on_filter_change=self._handle_filter_change,
-            show_filter_option=show_filter_option
-        )
+        # Re-show the list until the user leaves or picks a replica
+        while True:
+            # Filtered, sectioned view is built once per filter type and reused across page turns
+            paginated_list = self._get_sectioned_list(filter_type)
+
+            if not paginated_list.items:
+                # Create empty paginated list for proper empty state handling
+                result = PaginatedList([]).show(
+                    title=title,
+                    filter_type=filter_type,
+                    on_filter_change=self._handle_filter_change,
+                    show_filter_option=show_filter_option
+                )
+            else:
+                paginated_list.set_page(page)
+                result = paginated_list.show(
+                    title=title,
+                    filter_type=filter_type,
+                    on_item_select=on_replica_select_wrapper,
+                    on_filter_change=self._handle_filter_change,
+                    show_filter_option=show_filter_option
+                )
+
+            if result.action in (PaginationAction.PREVIOUS_PAGE, PaginationAction.NEXT_PAGE):
+                page = result.data
+            elif result.action == PaginationAction.GO_BACK:
+                return None  # Cancel selection
+            elif result.action == PaginationAction.FILTER_CHANGED:
+                # Ask for a new filter and start again from its first page
+                filter_type = self._show_filter_selection()
+                page = 0
+            elif result.action == PaginationAction.ITEM_SELECTED:
+                # Return the state from the custom callback or replica ID
+                return result.data
+            else:
+                # Use the page from result.data if available, otherwise default to 0
+                page = result.data if result.data is not None else 0
+    
+    def remove_replica(self, replica):
+        """Remove a replica from the list and its type group"""
+        self.replicas.remove(replica)
+        self._by_type[replica.replica_type].remove(replica)
+        self._sectioned_lists.clear()
+    
+    def _get_sectioned_list(self, filter_type):
+        """Return the sectioned paginated list for a filter type, building it on first use"""
+        paginated_list = self._sectioned_lists.get(filter_type)
+        if paginated_list is None:
+            # Filter replicas based on type
+            user_replicas = self._by_type.get("user", [])
+            system_replicas = self._by_type.get("system", [])
+            if filter_type == "user":
+                sectioned_replicas = [user_replicas]
+                section_names = ["User Replicas"]
+            elif filter_type == "system":
+                sectioned_replicas = [system_replicas]
+                section_names = ["System Replicas"]
+            else:  # "all"
+                sectioned_replicas = [user_replicas, system_replicas]
+                section_names = ["User Replicas", "System Replicas"]
 
-        return self._handle_pagination_result(result, state_machine, page, filter_type, on_replica_select, show_filter_option, title, return_replica_id)
+            # Create sectioned paginated list; set_sections flattens the sections into its items
+            paginated_list = SectionedPaginatedList([], self.items_per_page)
+            paginated_list.set_sections(sectioned_replicas, section_names)
+            self._sectioned_lists[filter_type] = paginated_list
+        return paginated_list
+    
+    def clear_choices_cache(self):
+        """Drop cached menu choices of every filtered view; call after renaming a replica"""
+        for paginated_list in self._sectioned_lists.values():
+            paginated_list.clear_choices_cache()
     
     def _handle_filter_change(self, filter_type):
         """Handle filter change"""
         return PaginatedListResult(PaginationAction.FILTER_CHANGED, filter_type)
 
-    def _handle_pagination_result(self, result, state_machine, page, filter_type, on_replica_select, show_filter_option, title, return_replica_id):
-        """Handle pagination result"""
-        if result.action == PaginationAction.PREVIOUS_PAGE:
-            return self.show(state_machine, result.data, filter_type, on_replica_select, show_filter_option, title, return_replica_id)
-        elif result.action == PaginationAction.NEXT_PAGE:
-            return self.show(state_machine, result.data, filter_type, on_replica_select, show_filter_option, title, return_replica_id)
-        elif result.action == PaginationAction.GO_BACK:
-            return None  # Cancel selection
-        elif result.action == PaginationAction.FILTER_CHANGED:
-            # Handle filter change - show filter selection
-            return self._show_filter_selection(state_machine, on_replica_select, show_filter_option, title, return_replica_id)
-        elif result.action == PaginationAction.ITEM_SELECTED:
-            # Return the state from the custom callback or replica ID
-            return result.data
-        else:
-            # Use the page from result.data if available, otherwise default to 0
-            current_page = result.data if result.data is not None else 0
-            return self.show(state_machine, current_page, filter_type, on_replica_select, show_filter_option, title, return_replica_id)
-
-    def _show_filter_selection(self, state_machine, on_replica_select=None, show_filter_option=True, title="Replicas", return_replica_id=False):
-        """Show filter selection for replicas"""
+    def _show_filter_selection(self) -> str:
+        """Show filter selection for replicas and return the chosen filter type"""
         print("\n=== Filter Replicas ===")
         
-        cli = Bullet(
-            prompt="Select filter type:",
-            choices=["user", "system", "all"],
-            bullet="→",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        if result == "user":
-            return self.show(state_machine, filter_type="user", on_replica_select=on_replica_select, show_filter_option=show_filter_option, title=title, return_replica_id=return_replica_id)
-        elif result == "system":
-            return self.show(state_machine, filter_type="system", on_replica_select=on_replica_select, show_filter_option=show_filter_option, title=title, return_replica_id=return_replica_id)
-        elif result == "all":
-            return self.show(state_machine, filter_type="all", on_replica_select=on_replica_select, show_filter_option=show_filter_option, title=title, return_replica_id=return_replica_id)
-        
-        return self.show(state_machine, filter_type="all", on_replica_select=on_replica_select, show_filter_option=show_filter_option, title=title, return_replica_id=return_replica_id)
+        if self._filter_cli is None:
+            self._filter_cli = Bullet(
+                prompt="Select filter type:",
+                choices=["user", "system", "all"],
+                bullet="→",
+                margin=2,
+                shift=0,
+            )
+        result = self._filter_cli.launch()
+        return result if result in ("user", "system", "all") else "all"
     
     def _show_replica_details(self, replica):
         """Show detailed information for a specific replica"""
-        print("\n" + "=" * 60)
-        print("REPLICA DETAILS")
-        print("=" * 60)
-        print(replica.display_verbose())
-        print("=" * 60) 
\ No newline at end of file
+        sys.stdout.write(f"\n{_SEP60}REPLICA DETAILS\n{_SEP60}{replica.display_verbose()}\n{_SEP60}")
+        sys.stdout.flush() 
\ No newline at end of file
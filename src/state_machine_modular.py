@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
-from bullet import Bullet
-from modules import ModuleRegistry, ModuleInterface, CommonStates
+from modules import ModuleRegistry, ModuleInterface, CommonStates, StaticMenu
 from modules.api_key_module import APIKeyModule
 from modules.replica_module import ReplicaModule
 from modules.persona_module import PersonaModule
@@ -20,6 +19,13 @@ class StateMachineModular:
         ConversationModule,
     ]
     
+    __slots__ = ('api_client', 'api_key', 'current_state', 'module_registry', '_main_menu_cli')
+    
+    # States handled by the state machine itself, mapped to their handler method names
+    _DISPATCH = {
+        CommonStates.MAIN_MENU: "_execute_main_menu",
+    }
+    
     def __init__(self):
         self.api_client = None
         self.api_key = None
@@ -30,6 +36,9 @@ class StateMachineModular:
         
         # Register modules
         self._register_modules()
+        
+        # Main menu widget, built on first use once all modules are registered
+        self._main_menu_cli = None
     
     def _register_modules(self):
         """Register the modules with the state machine"""
@@ -39,11 +48,15 @@ class StateMachineModular:
     def register_module(self, module: ModuleInterface):
         """Register a new module with the state machine"""
         self.module_registry.register_module(module)
+        # Rebuild the main menu so it lists the new module's options
+        self._main_menu_cli = None
     
     def execute_current_state(self):
         """Execute the current state and update the next state"""
-        if self.current_state == CommonStates.MAIN_MENU:
-            self.current_state = self._execute_main_menu()
+        # States owned by the state machine itself are looked up in one step
+        method_name = self._DISPATCH.get(self.current_state)
+        if method_name:
+            self.current_state = getattr(self, method_name)()
         elif self.current_state == CommonStates.EXIT:
             # Exit state - do nothing, let the main loop handle it
             pass
@@ -61,28 +74,22 @@ class StateMachineModular:
         print("\n=== Main Menu ===")
         print(f"Tavus API key: {self.api_key}")
         
-        # Get menu options from registered modules
-        menu_options = self.module_registry.get_menu_options()
-        menu_options.append("Exit")
+        # Refresh module data in the background while the user picks a menu entry
+        self.prefetch()
         
-        cli = Bullet(
-            prompt="What would you like to do?",
-            choices=menu_options,
-            bullet="→",
-            margin=2,
-            shift=0,
-        )
-        result = cli.launch()
-
-        # Use module registry's choice-to-state mapping
-        choice_to_state_mapping = self.module_registry.get_choice_to_state_mapping()
-        
-        if result == "Exit":
-            return CommonStates.EXIT
-        elif result in choice_to_state_mapping:
-            return choice_to_state_mapping[result]
-        else:
-            return CommonStates.MAIN_MENU
+        if self._main_menu_cli is None:
+            # Map every menu option to its state once; the registry only changes on register_module
+            choice_to_state_mapping = self.module_registry.get_choice_to_state_mapping()
+            menu_states = {option: choice_to_state_mapping.get(option, CommonStates.MAIN_MENU)
+                           for option in self.module_registry.get_menu_options()}
+            menu_states["Exit"] = CommonStates.EXIT
+            
+            self._main_menu_cli = StaticMenu(
+                "What would you like to do?",
+                menu_states,
+                default_state=CommonStates.MAIN_MENU,
+            )
+        return self._main_menu_cli.launch()
     
     def set_api_client(self, api_client):
         """Set the API client instance"""
@@ -92,6 +99,11 @@ class StateMachineModular:
         """Set the API key"""
         self.api_key = api_key
 
+    def prefetch(self):
+        """Start loading module data in the background for the current API client and key"""
+        if self.api_client is not None:
+            self.module_registry.prefetch(self)
+
     def is_exit_state(self):
         """Check if current state is exit"""
         return self.current_state == CommonStates.EXIT 
\ No newline at end of file